@@ -1,14 +1,20 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import os
+import datetime
+import utils.assets as assets
+import utils.avatars as avatars
+import utils.charts as charts
+import utils.committee as committee
 import utils.helpers as helpers
+import utils.members as members
+import utils.metrics as metrics
+import utils.signups as signups
+import utils.survey as survey
 
 
 # Page Config
 st.set_page_config(
     page_title="QCS Community",
-    page_icon="assets/logo.png",
+    page_icon=assets.asset_url("assets/logo.png"),
     layout="wide",
 )
 
@@ -17,33 +23,12 @@ helpers.render_navigation("pages/03_Community.py")
 st.markdown("# 👥 Community Dashboard")
 
 # --- DATA LOADING ---
-CSV_PATH = "data/members.csv"
-COMMITTEE_PATH = "data/committee.json"
-
-import json
-import base64
 import urllib.parse
 
-
-def get_base64_image(image_path):
-    if os.path.exists(image_path):
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    return ""
-
-def load_committee():
-    if os.path.exists(COMMITTEE_PATH):
-        with open(COMMITTEE_PATH, 'r') as f:
-            return json.load(f)
-    return []
-
-def load_data():
-    if os.path.exists(CSV_PATH):
-        return pd.read_csv(CSV_PATH)
-    else:
-        return pd.DataFrame(columns=["ID", "Name", "Student number", "Faculty", "Email"])
-
-df = load_data()
+# Cached per members.csv version (only Name, Student number and Faculty are parsed)
+with metrics.span("data load"):
+    member_store = members.load_members()
+df = member_store.df
 
 # --- TOP METRIC ---
 # Aligning with user request to show this in "Large and Bold"
@@ -59,166 +44,67 @@ if not df.empty:
 # --- FACULTY PIE CHART ---
 if not df.empty and "Faculty" in df.columns:
     st.markdown("### 📊 Faculty Distribution")
-    faculty_counts = df['Faculty'].value_counts().reset_index()
-    faculty_counts.columns = ['Faculty', 'Count']
-    
-    fig = px.pie(
-        faculty_counts, 
-        values='Count', 
-        names='Faculty', 
-        hole=0.4,
-        color_discrete_sequence=px.colors.sequential.Bluyl
-    )
-    fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color="#FAFAFA"),
-        showlegend=True,
-    )
-    # Customize traces for nicer hover info
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    
-    st.plotly_chart(fig, width="stretch")
+    # Plotly figure is built once per (members file, theme) in the background;
+    # a static SVG donut is shown until it is ready
+    with metrics.span("chart build"):
+        charts.faculty_distribution(member_store, st.session_state.theme)
+
+# --- INTERESTS & EXPERIENCE ---
+# Survey aggregates are computed once per members.csv version; the HTML charts are cached too
+with metrics.span("chart build"):
+    stats = survey.load_stats()
+if stats.respondents:
+    st.markdown("### 🔬 Interests & Experience")
+    st.markdown(charts.SURVEY_CSS, unsafe_allow_html=True)
+    interest_col, level_col = st.columns(2)
+    with interest_col:
+        st.markdown("**What members want to learn**")
+        if stats.interests:
+            labels, values = zip(*stats.interests)
+            st.markdown(charts.bars_html(labels, values, stats.respondents), unsafe_allow_html=True)
+    with level_col:
+        st.markdown("**Experience by faculty**")
+        st.markdown(
+            charts.stacked_bars_html(tuple(stats.faculties), tuple(stats.levels), tuple(map(tuple, stats.level_counts))),
+            unsafe_allow_html=True,
+        )
+    with st.expander("Which interests go together?"):
+        st.markdown(
+            charts.heatmap_html(tuple(stats.matrix_labels), tuple(map(tuple, stats.matrix))),
+            unsafe_allow_html=True,
+        )
+        st.caption("Members who listed both interests; the diagonal is each interest's total.")
+    for col, title, counts in zip(
+        st.columns(2),
+        ("**Why members joined**", "**Roles members would take on**"),
+        (stats.reasons, stats.roles),
+    ):
+        with col:
+            st.markdown(title)
+            if counts:
+                labels, values = zip(*counts)
+                st.markdown(charts.bars_html(labels, values, stats.respondents), unsafe_allow_html=True)
 
 # --- COMMITTEE SECTION ---
 st.markdown("### 👔 QCS Committee 2026")
-committee_data = load_committee()
+committee_data = committee.load_committee()
 
 if committee_data:
     # Custom CSS for cards
-    st.markdown("""
-    <style>
-    .committee-card {
-        background-color: rgba(255, 255, 255, 0.05);
-        border: 1px solid rgba(0, 255, 255, 0.1);
-        border-radius: 10px;
-        padding: 20px;
-        text-align: center;
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        height: 100%;
-    }
-    .committee-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 5px 15px rgba(0, 255, 255, 0.2);
-        border-color: #00FFFF;
-    }
-    .committee-img {
-        width: 100px;
-        height: 100px;
-        border-radius: 50%;
-        object-fit: cover;
-        border: 2px solid #00FFFF;
-        margin-bottom: 10px;
-        background-color: #fff; /* Ensure transparent pngs look okay */
-    }
-    .committee-role {
-        color: #00FFFF;
-        font-weight: bold;
-        font-size: 0.9rem;
-        margin-bottom: 5px;
-        height: 40px; /* Fixed height for alignment */
-        display: flex;
-        align-items: center;
-        justify-content: center;
-    }
-    .committee-name {
-        color: #FAFAFA; /* Or inherit */
-        font-size: 1rem;
-        font-weight: 500;
-        margin-bottom: 10px;
-    }
-    .linkedin-block {
-        display: block;
-        margin-top: 10px;
-        padding: 8px 12px;
-        border-radius: 5px;
-        font-size: 0.8rem;
-        font-weight: bold;
-        text-decoration: none;
-        transition: all 0.3s ease;
-        
-        /* Default (Dark Mode) - match theme */
-        background-color: rgba(0, 255, 255, 0.1);
-        border: 1px solid #00FFFF;
-        color: #00FFFF !important;
-    }
-    .linkedin-block:hover {
-        background-color: #00FFFF;
-        color: #000 !important;
-    }
+    st.markdown(committee.CARD_CSS, unsafe_allow_html=True)
 
-    /* Light Mode Overrides (assuming body background check or media query) */
-    @media (prefers-color-scheme: light) {
-        .linkedin-block {
-            background-color: #ffffff;
-            border: 1px solid #00d4ff; /* Bluish border */
-            color: #000000 !important;
-        }
-        .linkedin-block:hover {
-            background-color: #00d4ff;
-            color: #ffffff !important;
-        }
-    }
-    /* Explicit light mode class if streamlits theme injection is detectable, 
-       but standard media query is safest for system preference. 
-       User said "in light mode", might imply the app theme setting. */
-    </style>
-    """, unsafe_allow_html=True)
+    # Each distinct avatar is encoded once (pre-resized, cached per process) and shared by class
+    with metrics.span("html render"):
+        st.markdown(avatars.avatar_css([m['image'] for m in committee_data]), unsafe_allow_html=True)
 
     # Grid Layout
     cols = st.columns(4)
     for i, member in enumerate(committee_data):
         with cols[i % 4]:
-            # Resolve image path
-            img_path = member['image']
-            img_b64 = get_base64_image(img_path)
-            
-            if img_b64:
-                img_src = f"data:image/png;base64,{img_b64}"
-            else:
-                img_src = "https://via.placeholder.com/100?text=QCS"
-
-            # Prepare Card HTML content
-            # We construct the inner content first
-            card_content = f"""
-<img src="{img_src}" class="committee-img">
-<div class="committee-role">{member['role']}</div>
-<div class="committee-name">{member['name']}</div>
-"""
-            
-            # Add Link Block if available
-            linkedin_url = member.get('linkedin', '')
-            if linkedin_url:
-                # Dynamic Link Text
-                if member['name'] == "TBD":
-                    link_text = "Follow Us on LinkedIn"
-                else:
-                    first_name = member['name'].split()[0]
-                    link_text = f"Visit {first_name}'s LinkedIn"
-                
-                # Append the styled block - FLUSH LEFT
-                card_content += f"""
-<div class="linkedin-block">
-{link_text}
-</div>
-"""
-                
-                # Wrap entire card in A tag for clickability - FLUSH LEFT
-                wrapper = f"""
-<a href="{linkedin_url}" target="_blank" style="text-decoration: none; color: inherit; display: block; height: 100%;">
-<div class="committee-card">
-{card_content}
-</div>
-</a>
-"""
-                st.markdown(wrapper, unsafe_allow_html=True)
-            else:
-                # Non-clickable card - FLUSH LEFT
-                st.markdown(f"""
-<div class="committee-card">
-{card_content}
-</div>
-""", unsafe_allow_html=True)
+            # Resolve image class
+            img_class = avatars.avatar_class(member['image'])
+
+            st.markdown(committee.card_html(member, img_class), unsafe_allow_html=True)
 
             st.markdown("<br>", unsafe_allow_html=True) # Spacing
 else:
@@ -229,19 +115,10 @@ st.markdown("---")
 # --- MEMBER LIST ---
 st.markdown("### 📋 Member List")
 if not df.empty:
-    # Display only public columns
+    # Display only public columns (members.TABLE_COLS)
     # User might not want student numbers publicly visible, but requested to "show names". 
     # Safest is Name + Faculty.
-    display_cols = ["Name", "Faculty"]
-    
-    # Simple search
-    search_term = st.text_input("Search members by name", "")
-    
-    if search_term:
-        filtered_df = df[df['Name'].str.contains(search_term, case=False, na=False)]
-    else:
-        filtered_df = df
-        
+
     # Display as a styled HTML table for full control (Light Mode support)
     # Using st.html or st.markdown with pandas style
     
@@ -271,11 +148,42 @@ if not df.empty:
     */
     </style>
     """, unsafe_allow_html=True)
-    
-    # Convert to HTML
-    html_table = filtered_df[display_cols].to_html(classes="member-table", index=False, escape=False)
-    st.markdown(html_table, unsafe_allow_html=True)
-    
+
+    def reset_member_page():
+        # One page key for the whole session; a new query or sort starts at page 1
+        st.session_state.pop("member_page", None)
+
+    # A fragment: typing, sorting and paging rerun only the member table,
+    # not the charts and committee cards above it
+    @st.fragment
+    def member_list(member_store):
+        metrics.start_fragment("pages/03_Community.py", "member list")
+        # Search via the cached name index (substring first, then closest names for typos)
+        search_col, sort_col = st.columns([3, 1])
+        with search_col:
+            search_term = st.text_input("Search members by name", "", on_change=reset_member_page)
+        with sort_col:
+            sort_by = st.selectbox("Sort by", options=list(members.TABLE_SORTS), on_change=reset_member_page)
+
+        # Only the visible page is rendered (cached per file version, query, sort and page)
+        page = st.session_state.get("member_page", 1)
+        with metrics.span("html render"):
+            table = members.member_table(member_store, search_term, sort_by, page)
+
+            if table["fuzzy"] and table["total"]:
+                st.caption("No exact matches. Showing the closest names.")
+            st.markdown(table["html"], unsafe_allow_html=True)
+
+        if table["pages"] > 1:
+            info_col, page_col = st.columns([3, 1])
+            with page_col:
+                st.number_input("Page", min_value=1, max_value=table["pages"], value=table["page"], key="member_page")
+            with info_col:
+                st.caption(f"Showing {table['first']}-{table['last']} of {table['total']} members")
+        else:
+            st.caption(f"{table['total']} member{'' if table['total'] == 1 else 's'}")
+
+    member_list(member_store)
 else:
     st.info("No members found yet.")
 
@@ -283,76 +191,75 @@ else:
 st.markdown("---")
 st.markdown("### 📝 Join the Society")
 
-# New Prospective Members File
-PROSPECTIVE_PATH = "data/prospective_members.csv"
+# Prospective members are appended (never rewritten) through a shared, locked store
+prospective_store = signups.get_store()
 
-with st.form("signup_form"):
-    col1, col2 = st.columns(2)
-    with col1:
-        new_name = st.text_input("Full Name")
-        new_student_num = st.text_input("Student Number")
-    with col2:
-        # Pre-populate faculties found in CSV + 'Other'
-        existing_faculties = sorted(df['Faculty'].dropna().unique().tolist()) if not df.empty else []
-        if "Other" not in existing_faculties:
-            existing_faculties.append("Other")
+# A fragment: submitting reruns only the form and its messages
+@st.fragment
+def signup_form(member_store, prospective_store):
+    metrics.start_fragment("pages/03_Community.py", "sign-up")
+    with st.form("signup_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            new_name = st.text_input("Full Name")
+            new_student_num = st.text_input("Student Number")
+        with col2:
+            # Pre-populate faculties found in CSV + 'Other'
+            existing_faculties = list(member_store.faculties)
+            if "Other" not in existing_faculties:
+                existing_faculties.append("Other")
 
-        new_faculty = st.selectbox("Faculty", options=existing_faculties)
-        new_email = st.text_input("Email (Optional)")
+            new_faculty = st.selectbox("Faculty", options=existing_faculties)
+            new_email = st.text_input("Email (Optional)")
 
-    submitted = st.form_submit_button("Sign Up")
+        submitted = st.form_submit_button("Sign Up")
     
-    if submitted:
-        if new_name and new_student_num:
-            # Check for duplicates in MAIN list and PROSPECTIVE list
-            
-            # Load prospective to check there too
-            if os.path.exists(PROSPECTIVE_PATH):
-                df_prospective = pd.read_csv(PROSPECTIVE_PATH)
-            else:
-                df_prospective = pd.DataFrame(columns=["Name", "Student number", "Faculty", "Email", "Date Joined"])
-                
-            # Check Main
-            exists_main = not df.empty and new_student_num in df['Student number'].astype(str).values
-            # Check Prospective
-            exists_prospective = not df_prospective.empty and new_student_num in df_prospective['Student number'].astype(str).values
-            
-            if exists_main or exists_prospective:
-                st.error("This student number is already registered or pending approval.")
-            else:
-                # Append new prospective member
+        if submitted:
+            if new_name and new_student_num:
+                new_student_num = new_student_num.strip()
+
                 new_row = {
                     "Name": new_name,
                     "Student number": new_student_num,
                     "Faculty": new_faculty,
                     "Email": new_email,
-                    "Date Joined": pd.Timestamp.now().strftime("%Y-%m-%d")
+                    "Date Joined": datetime.date.today().isoformat()
                 }
-                new_prospective_df = pd.DataFrame([new_row])
-                
-                updated_prospective = pd.concat([df_prospective, new_prospective_df], ignore_index=True)
-                updated_prospective.to_csv(PROSPECTIVE_PATH, index=False)
-                
-                st.success(f"Welcome, {new_name}! You have been added to the prospective members list.")
-                st.balloons()
+
+                # Check for duplicates in MAIN list and PROSPECTIVE list (normalized, O(1)).
+                # add() re-checks under the lock, so two simultaneous sign-ups can't both succeed
+                try:
+                    added = not signups.is_registered(new_student_num) and prospective_store.add(new_row)
+                except Exception:
+                    # Nothing was written (unreadable or unwritable file), so they can retry
+                    st.error("Your sign-up could not be saved. Please try again, or email uctqcs@gmail.com.")
+                    added = None
+                if added is False:
+                    st.error("This student number is already registered or pending approval.")
+                elif added:
+                    st.success(f"Welcome, {new_name}! You have been added to the prospective members list.")
+                    st.balloons()
                 
-                # Prepare Mailto Link
-                subject = f"New Member Registration: {new_name}"
-                body = f"Name: {new_name}\nStudent Number: {new_student_num}\nFaculty: {new_faculty}\nEmail: {new_email}"
+                    # Prepare Mailto Link
+                    subject = f"New Member Registration: {new_name}"
+                    body = f"Name: {new_name}\nStudent Number: {new_student_num}\nFaculty: {new_faculty}\nEmail: {new_email}"
                 
-                # Encode params
-                params = {
-                    "subject": subject,
-                    "body": body
-                }
-                query_string = urllib.parse.urlencode(params).replace("+", "%20")
-                mailto_link = f"mailto:uctqcs@gmail.com?{query_string}"
+                    # Encode params
+                    params = {
+                        "subject": subject,
+                        "body": body
+                    }
+                    query_string = urllib.parse.urlencode(params).replace("+", "%20")
+                    mailto_link = f"mailto:uctqcs@gmail.com?{query_string}"
                 
-                # Open email client
-                st.link_button("📧 Click here to complete registration (Send Email)", mailto_link)
+                    # Open email client
+                    st.link_button("📧 Click here to complete registration (Send Email)", mailto_link)
                 
-                # Auto-open (Javascript hack, optional but nice)
-                # st.markdown(f'<meta http-equiv="refresh" content="0;url={mailto_link}">', unsafe_allow_html=True)
+                    # Auto-open (Javascript hack, optional but nice)
+                    # st.markdown(f'<meta http-equiv="refresh" content="0;url={mailto_link}">', unsafe_allow_html=True)
                 
-        else:
-            st.warning("Please fill in at least Name and Student Number.")
+            else:
+                st.warning("Please fill in at least Name and Student Number.")
+
+
+signup_form(member_store, prospective_store)
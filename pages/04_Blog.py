@@ -1,13 +1,14 @@
 import streamlit as st
-import pandas as pd
-import json
-import os
+import html
+import utils.assets as assets
+import utils.blogs as blogs
 import utils.helpers as helpers
+import utils.metrics as metrics
 
 # Page Config
 st.set_page_config(
     page_title="QCS Blog",
-    page_icon="assets/logo.png",
+    page_icon=assets.asset_url("assets/logo.png"),
     layout="wide",
 )
 
@@ -16,75 +17,58 @@ helpers.render_navigation("pages/04_Blog.py")
 st.markdown("# 📰 QCS Research Highlights")
 
 # --- DATA LOADING ---
-BLOGS_PATH = "data/blogs.json"
-
-def load_blogs():
-    if os.path.exists(BLOGS_PATH):
-        with open(BLOGS_PATH, 'r') as f:
-            return json.load(f)
-    return []
-
-blogs = load_blogs()
+# Sorted, id-indexed and pre-built once per blogs.json version
+with metrics.span("data load"):
+    blog_store = blogs.load_blogs()
 
 # --- LAYOUT ---
-if not blogs:
+if not blog_store:
     st.info("No blog posts available yet. Check back soon!")
 else:
     # Sidebar for filtering/selection
     st.sidebar.header("Recent Posts")
-    
-    # Sort blogs by date desc
-    blogs.sort(key=lambda x: x['date'], reverse=True)
-    
+    search_query = st.sidebar.text_input("Search posts", "")
+    tag_filter = st.sidebar.selectbox("Tag", options=["All"] + blog_store.tags)
+
+    # Ranked by relevance when searching, otherwise newest first
+    post_ids = blog_store.search(search_query, None if tag_filter == "All" else tag_filter)
+
+    if search_query.strip():
+        st.markdown(f"**{len(post_ids)} result{'' if len(post_ids) == 1 else 's'} for \"{search_query.strip()}\"**")
+        for post_id in post_ids[:10]:
+            post = blog_store.by_id[post_id]
+            st.markdown(
+                f"<div><b>{html.escape(post['title'])}</b> <small>({html.escape(str(post['date']))})</small><br>"
+                f"<small>{blogs.snippet(post['content'], search_query)}</small></div>",
+                unsafe_allow_html=True,
+            )
+        st.markdown("---")
+
     # Selection
     selected_blog_id = st.sidebar.radio(
         "Select a post",
-        options=[b['id'] for b in blogs],
-        format_func=lambda x: next((b['title'] for b in blogs if b['id'] == x), "Unknown")
+        options=post_ids,
+        format_func=lambda x: blog_store.titles.get(x, "Unknown")
     )
     
     # Find selected blog
-    current_blog = next((b for b in blogs if b['id'] == selected_blog_id), None)
+    current_blog = blog_store.rendered.get(selected_blog_id)
     
     if current_blog:
-        st.markdown(f"## {current_blog['title']}")
-        st.markdown(f"**By {current_blog['author']}** | *{current_blog['date']}* | 🏷️ `{current_blog['tag']}`")
+        st.markdown(current_blog['title'])
+        st.markdown(current_blog['byline'])
         st.markdown("---")
-        st.markdown(current_blog['content'])
+        # Rendered to HTML once per post (see BlogStore.content_html)
+        st.markdown(blog_store.content_html(selected_blog_id), unsafe_allow_html=True)
         
         # Citation Card
-        if 'pdf_url' in current_blog:
-            # IEEE Citation format: [1] A. Author, "Title," Source, Month Year. [Online]. Available: URL
-            citation_text = f'[1] {current_blog["author"]}, "{current_blog["title"]}", *Nature Communications*, {current_blog["date"]}. [Online]. Available: {current_blog["pdf_url"]}'
-            
+        if current_blog['citation']:
             st.markdown("---")
             st.markdown("### Citation")
             
             # Card styling
-            st.markdown(
-                f"""
-                <a href="{current_blog['pdf_url']}" target="_blank" style="text-decoration: none; color: inherit;">
-                    <div style="
-                        border: 1px solid #ddd;
-                        border-radius: 8px;
-                        padding: 15px;
-                        background-color: #f9f9f9;
-                        cursor: pointer;
-                        transition: box-shadow 0.3s;
-                    " onmouseover="this.style.boxShadow='0 4px 8px rgba(0,0,0,0.1)'" onmouseout="this.style.boxShadow='none'">
-                        <div style="display: flex; align-items: center;">
-                            <div style="font-size: 24px; margin-right: 15px;">📄</div>
-                            <div>
-                                <div style="font-weight: bold; margin-bottom: 5px; color: #333;">PDF Source</div>
-                                <div style="font-size: 0.9em; color: #555;">
-                                    {citation_text}
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </a>
-                """,
-                unsafe_allow_html=True
-            )
-    else:
+            st.markdown(current_blog['citation'], unsafe_allow_html=True)
+    elif post_ids:
         st.error("Blog post not found.")
+    else:
+        st.info("No posts match your search.")
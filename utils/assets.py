@@ -0,0 +1,198 @@
+"""
+Fingerprinted copies of assets/ for Streamlit's static file serving.
+
+    python -m utils.assets
+
+Copies every file in assets/ to static/<name>.<hash><ext>, next to .gz (and
+.br when the brotli package is installed) variants for the formats that
+compress, and records the mapping in static/manifest.json. Unchanged files
+are not re-hashed or re-compressed. `asset_url` then resolves an assets/ path
+to its /app/static/ URL, so a new version of a file always gets a new URL and
+the old one can be cached forever.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import urllib.parse
+
+import streamlit as st
+
+from utils.files import file_version
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are written without it
+    brotli = None
+
+ASSETS_DIR = "assets"
+STATIC_DIR = "static"
+MANIFEST_PATH = os.path.join(STATIC_DIR, "manifest.json")
+STATIC_URL = "/app/static/"
+
+# Text-like formats; images are already compressed
+COMPRESS_EXTS = {".css", ".js", ".json", ".svg", ".html", ".txt", ".pdf"}
+# A variant is only kept when it is at least this much smaller
+MIN_SAVING = 0.05
+
+logger = logging.getLogger(__name__)
+
+_warned = set()  # assets already reported as missing from static/
+
+
+def _fingerprint(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hashed_name(name, digest):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{digest[:10]}{ext}"
+
+
+def _write_variants(path, data):
+    """Writes .gz/.br next to `path`; returns the encodings kept."""
+    encodings = []
+    variants = [("gzip", ".gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(("br", ".br", lambda d: brotli.compress(d, quality=11)))
+    for encoding, suffix, compress in variants:
+        packed = compress(data)
+        if len(packed) <= len(data) * (1 - MIN_SAVING):
+            with open(path + suffix, "wb") as f:
+                f.write(packed)
+            encodings.append(encoding)
+    return encodings
+
+
+def _read_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def build(src_dir=ASSETS_DIR, out_dir=STATIC_DIR):
+    """
+    Brings `out_dir` in line with `src_dir`. Returns (manifest, rebuilt paths).
+
+    Files whose size and mtime match the manifest are skipped without being
+    read; outputs for deleted or changed sources are removed.
+    """
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    old = _read_manifest(manifest_path)
+    manifest, rebuilt = {}, []
+    os.makedirs(out_dir, exist_ok=True)
+
+    for name in sorted(os.listdir(src_dir)):
+        src = os.path.join(src_dir, name)
+        if name.startswith(".") or not os.path.isfile(src):
+            continue
+        key = f"{src_dir}/{name}"
+        stat = os.stat(src)
+        entry = old.get(key)
+        if (entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns
+                and os.path.exists(os.path.join(out_dir, entry["file"]))):
+            manifest[key] = entry
+            continue
+
+        digest = _fingerprint(src)
+        hashed = _hashed_name(name, digest)
+        dest = os.path.join(out_dir, hashed)
+        with open(src, "rb") as f:
+            data = f.read()
+        tmp = f"{dest}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, dest)
+        encodings = []
+        if os.path.splitext(name)[1].lower() in COMPRESS_EXTS:
+            encodings = _write_variants(dest, data)
+        manifest[key] = {
+            "file": hashed,
+            "sha256": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "encodings": encodings,
+        }
+        rebuilt.append(key)
+
+    # Remove outputs nothing points to any more
+    keep = {entry["file"] for entry in manifest.values()}
+    for key, entry in old.items():
+        if entry["file"] not in keep:
+            for suffix in ("", ".gz", ".br"):
+                try:
+                    os.remove(os.path.join(out_dir, entry["file"] + suffix))
+                except FileNotFoundError:
+                    pass
+
+    tmp = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, manifest_path)
+    return manifest, rebuilt
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_manifest(version):
+    return _read_manifest() if version else {}
+
+
+def _current_entry(path):
+    """The manifest entry for `path` if it was built from the file as it is now."""
+    entry = _load_manifest(file_version(MANIFEST_PATH)).get(path)
+    if entry is not None and (entry["mtime_ns"], entry["size"]) == file_version(path):
+        return entry
+    return None
+
+
+def _warn_unbuilt(path):
+    """Logs once per path and process that `path` has no current static copy."""
+    if path not in _warned:
+        _warned.add(path)
+        logger.warning("%s has no current copy in %s/; run `python -m utils.assets` when deploying", path, STATIC_DIR)
+
+
+def served_url(path):
+    """
+    The fingerprinted /app/static/ URL for an assets/ path, or None when it
+    cannot be served (static serving off, missing file, static/ not built for
+    the file as it is now). For raw HTML, where the browser fetches the URL
+    itself. static/ is built at deploy time, never while serving a page.
+    """
+    if not st.get_option("server.enableStaticServing"):
+        return None
+    entry = _current_entry(path)
+    if entry is None:
+        if os.path.isfile(path):
+            _warn_unbuilt(path)
+        return None
+    return STATIC_URL + urllib.parse.quote(entry["file"])
+
+
+def asset_url(path):
+    """
+    `served_url(path)`, or `path` itself when there is none. Only for
+    st.image, page_icon and the like, which read a local path themselves;
+    raw HTML needs `served_url`.
+    """
+    return served_url(path) or path
+
+
+def main():
+    manifest, rebuilt = build()
+    print(f"{len(manifest)} assets in {STATIC_DIR}/, {len(rebuilt)} rebuilt")
+    for key in rebuilt:
+        entry = manifest[key]
+        variants = ", ".join(entry["encodings"]) or "none"
+        print(f"  {key} -> {entry['file']} (precompressed: {variants})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import base64
+import hashlib
+import io
+
+import streamlit as st
+
+import utils.sharedcache as sharedcache
+from utils.helpers import file_version, lazy_import
+
+Image = lazy_import("PIL.Image")
+ImageOps = lazy_import("PIL.ImageOps")
+
+# Display size of committee avatars in CSS pixels; a 2x copy is built for HiDPI screens
+AVATAR_SIZE = 100
+PLACEHOLDER_URL = "https://via.placeholder.com/100?text=QCS"
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _content_hash(path, version):
+    """Short content hash of an image file. `version` keys the cache."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _thumbnail_uris(digest, path):
+    """
+    Square 1x/2x WebP thumbnails as data URIs, built once per content hash
+    (across workers, through the shared cache). `path` is only read on a
+    cache miss; identical files share one entry.
+    """
+    key = sharedcache.content_key(digest, AVATAR_SIZE)
+    return sharedcache.get_or_build("avatars", key, lambda: _encode_thumbnails(path))
+
+
+def _encode_thumbnails(path):
+    with Image.open(path) as img:
+        img = ImageOps.exif_transpose(img).convert("RGBA")
+        uris = {}
+        for scale in (1, 2):
+            size = AVATAR_SIZE * scale
+            thumb = ImageOps.fit(img, (size, size), Image.LANCZOS)
+            buf = io.BytesIO()
+            # method 6 is ~80x slower than 4 for ~2% smaller files; this runs on a worker's first Community view
+            thumb.save(buf, format="WEBP", quality=85, method=4)
+            uris[scale] = "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode()
+    return uris
+
+
+def avatar_class(image_path):
+    """CSS class name for an image, shared by every card using the same picture."""
+    version = file_version(image_path)
+    if version is None:
+        return "avatar-placeholder"
+    return f"avatar-{_content_hash(image_path, version)}"
+
+
+def avatar_css(image_paths):
+    """
+    One <style> block holding each distinct avatar exactly once.
+
+    Cards then reference the image through `avatar_class(path)` instead of
+    inlining a base64 copy per card.
+    """
+    return _avatar_css(tuple((path, file_version(path)) for path in image_paths))
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _avatar_css(versions):
+    image_paths = [path for path, _ in versions]
+    rules = [f'.avatar-placeholder{{background-image:url("{PLACEHOLDER_URL}")}}']
+    seen = set()
+    for path in image_paths:
+        cls = avatar_class(path)
+        if cls in seen or cls == "avatar-placeholder":
+            continue
+        seen.add(cls)
+        uris = _thumbnail_uris(cls[len("avatar-"):], path)
+        rules.append(
+            f'.{cls}{{background-image:url("{uris[1]}");'
+            f'background-image:image-set(url("{uris[1]}") 1x,url("{uris[2]}") 2x)}}'
+        )
+    return "<style>" + "".join(rules) + "</style>"
@@ -0,0 +1,363 @@
+"""
+Render benchmarks for every page, driven through streamlit.testing.v1.AppTest.
+
+    python -m utils.bench [--scales 10 100 1000] [--repeat 3] [--against REF] [--update-baseline]
+
+Each scale runs in a scratch copy of the app in a temporary directory, with
+its own process. The scratch copy links to the code and assets, gets its own
+copy of static/, and its data/ holds synthetic members.csv, events.json and
+blogs.json at that multiple of today's size, so neither the real data nor
+static/ is touched. Every case records wall time, the number of emitted
+elements and the Markdown/HTML (including CSS) bytes sent. Pages see a fixed
+"today" (TODAY), so the calendar shows the same month on any date.
+
+Element counts and bytes do not depend on the machine; they are compared to
+benchmarks/baseline.json. Wall times only mean something next to a run on
+the same host, so they are gated only with --against: the tree of that git
+ref (e.g. main) is benchmarked in the same run, on the same synthetic data,
+and each case's time is compared to it. The command exits 1 on a regression.
+"""
+import argparse
+import csv
+import datetime
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+BASELINE_PATH = "benchmarks/baseline.json"
+SCALES = (10, 100, 1000)
+
+# With --against, wall time may grow by TIME_TOLERANCE (plus TIME_SLACK_MS of
+# noise) over the reference before it counts as a regression. Element counts
+# and bytes are near-deterministic and checked against the stored baseline.
+TIME_TOLERANCE = 0.5
+TIME_SLACK_MS = 25
+SIZE_TOLERANCE = 0.05
+SIZE_METRICS = ("elements", "bytes")
+
+# The code is linked into the scratch app; data/ is synthetic and static/ a copy
+LINKED = ["home.py", "pages", "utils", "assets", ".streamlit"]
+# static/ is rebuilt from the scratch data for these, so they are not copied
+STATIC_GENERATED = {"feeds"}
+SEED = 2026
+# "Today" for the pages under test (events.TODAY_ENV), inside the synthetic
+# year, so the calendar cases render the same months whenever the bench runs
+TODAY = "2026-03-15"
+
+# Runs utils/bench.py from this tree inside a scratch app whose utils/ may come
+# from another ref (which may predate the benchmarks)
+_WORKER = "import runpy, sys; path = sys.argv.pop(1); sys.argv[0] = path; runpy.run_path(path, run_name='__main__')"
+
+
+# --- SYNTHETIC DATA ---
+def _synth_members(src, dest, scale, rng):
+    with open(src, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        fields, rows = reader.fieldnames, list(reader)
+    first = [r["Name"].split()[0] for r in rows if r["Name"].split()]
+    last = [r["Name"].split()[-1] for r in rows if r["Name"].split()]
+    with open(dest, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for i in range(len(rows) * scale):
+            row = dict(rows[i % len(rows)])
+            number = f"SYN{i:06d}"
+            row.update({
+                "ID": str(i + 1),
+                "Name": f"{rng.choice(first)} {rng.choice(last)}",
+                "Student number": number,
+                "Email": f"{number}@myuct.ac.za",
+            })
+            writer.writerow(row)
+
+
+def _synth_events(src, dest, scale, rng):
+    with open(src) as f:
+        events = json.load(f)
+    out = []
+    for copy in range(scale):
+        for event in events:
+            day = datetime.date(2026, 1, 1) + datetime.timedelta(days=rng.randrange(365))
+            out.append(dict(event, id=len(out) + 1, date=day.isoformat(),
+                            title=event["title"] if copy == 0 else f"{event['title']} #{copy}"))
+    # An open-ended weekly series: month views must not slow down as it runs on
+    out.append(dict(events[0], id=len(out) + 1, date="2026-01-08", title="Weekly Talk",
+                    rrule="FREQ=WEEKLY;BYDAY=TH", cancelled=["2026-04-02"]))
+    with open(dest, "w") as f:
+        json.dump(out, f)
+
+
+def _synth_blogs(src, dest, scale, rng):
+    with open(src) as f:
+        posts = json.load(f)
+    out = []
+    for copy in range(scale):
+        for post in posts:
+            words = post["content"].split()
+            day = datetime.date.fromisoformat(post["date"][:10]) - datetime.timedelta(days=copy)
+            out.append(dict(
+                post,
+                id=len(out) + 1,
+                date=day.isoformat(),
+                title=post["title"] if copy == 0 else f"{post['title']} ({copy})",
+                content=post["content"] if copy == 0 else " ".join(rng.sample(words, len(words))),
+            ))
+    with open(dest, "w") as f:
+        json.dump(out, f)
+
+
+def make_app(root, scale, src=".", code=None):
+    """
+    Scratch app in `root`: links to the code in `code` (default `src`), a copy
+    of src/static (pages write image variants and feeds into it), synthetic
+    data at `scale`x from src/data.
+    """
+    code = code or src
+    for name in LINKED:
+        if os.path.exists(os.path.join(code, name)):
+            os.symlink(os.path.abspath(os.path.join(code, name)), os.path.join(root, name))
+    static = os.path.join(src, "static")
+    if os.path.isdir(static):
+        shutil.copytree(static, os.path.join(root, "static"), ignore=lambda d, names: STATIC_GENERATED & set(names))
+    data = os.path.join(root, "data")
+    os.makedirs(data)
+    rng = random.Random(SEED)
+    _synth_members(os.path.join(src, "data/members.csv"), os.path.join(data, "members.csv"), scale, rng)
+    _synth_events(os.path.join(src, "data/events.json"), os.path.join(data, "events.json"), scale, rng)
+    _synth_blogs(os.path.join(src, "data/blogs.json"), os.path.join(data, "blogs.json"), scale, rng)
+    shutil.copy(os.path.join(src, "data/committee.json"), data)
+    with open(os.path.join(src, "data/prospective_members.csv"), newline="") as f:
+        header = f.readline()
+    with open(os.path.join(data, "prospective_members.csv"), "w", newline="") as f:
+        f.write(header)
+
+
+# --- CASES (run inside the scratch app) ---
+def _payload(at):
+    """(elements, Markdown/HTML bytes) currently on screen."""
+    elements, size = 0, 0
+    stack = [at._tree]
+    while stack:
+        node = stack.pop()
+        children = getattr(node, "children", None)
+        if children is not None:
+            stack.extend(children.values())
+            continue
+        elements += 1
+        proto = getattr(node, "proto", None)
+        if proto is not None and proto.DESCRIPTOR.name in ("Markdown", "Html"):
+            size += len(proto.body.encode())
+    return elements, size
+
+
+def _open(page):
+    from streamlit.testing.v1 import AppTest
+
+    # Page links only resolve when the app is started from the main script
+    at = AppTest.from_file(os.path.abspath("home.py"), default_timeout=120)
+    if page != "home.py":
+        at.run()
+        at.switch_page(page)
+    return at
+
+
+def _search(at):
+    for query in ("a", "an", "ann"):
+        at.text_input[0].input(query).run()
+
+
+def _sign_up(at):
+    inputs = [w for w in at.text_input if w.label in ("Full Name", "Student Number")]
+    inputs[0].input("Bench Mark")
+    inputs[1].input(f"BEN{time.perf_counter_ns() % 10**6:06d}")
+    at.button[-1].click().run()
+
+
+def _switch_post(at):
+    # Synthetic post ids run 1..N; jump from the newest post to the oldest
+    radio = at.sidebar.radio[0]
+    last = len(radio.options)
+    radio.set_value(last if radio.value != last else 1).run()
+
+
+def _month_change(at):
+    current = at.date_input[0].value
+    at.date_input[0].set_value(current.replace(day=1, month=current.month % 12 + 1)).run()
+
+
+def _select_day(at):
+    days = at.selectbox(key=f"event_day_{at.date_input[0].value.year}_{at.date_input[0].value.month}")
+    days.set_value(days.options[-1] if len(days.options) > 1 else None).run()
+
+
+# page -> [(case name, action on an AppTest that has rendered the page)]
+CASES = {
+    "home.py": [("theme toggle", lambda at: at.button(key="desktop_theme_toggle").click().run())],
+    "pages/02_Events.py": [("month change", _month_change), ("day select", _select_day)],
+    "pages/03_Community.py": [("search keystrokes", _search), ("sign-up submit", _sign_up)],
+    "pages/04_Blog.py": [("post switch", _switch_post)],
+    "pages/05_About.py": [],
+}
+
+
+def run_cases(repeat, lenient=False):
+    """
+    {page: {case: {"ms", "elements", "bytes"}}}; load is measured cold, then
+    warm. `lenient` (for a reference tree that may predate a case) leaves out
+    cases that fail instead of aborting.
+    """
+    results = {}
+    for page, cases in CASES.items():
+        timings = {}
+        sizes = {}
+        for i in range(repeat + 1):
+            at = _open(page)
+            steps = [("load (cold)" if i == 0 else "load", lambda at: at.run())]
+            if i > 0:
+                steps += cases
+            for name, action in steps:
+                start = time.perf_counter()
+                try:
+                    action(at)
+                    if at.exception:
+                        raise RuntimeError(f"{page} / {name}: {at.exception[0].value}")
+                except Exception:
+                    if not lenient:
+                        raise
+                    break
+                timings.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+                sizes[name] = _payload(at)
+        results[page] = {
+            name: {"ms": round(statistics.median(ms), 1), "elements": sizes[name][0], "bytes": sizes[name][1]}
+            for name, ms in timings.items()
+        }
+    return results
+
+
+# --- DRIVER ---
+def export_ref(ref, dest):
+    """The tree of git `ref` written to `dest`."""
+    archive = subprocess.run(["git", "archive", "--format=tar", ref], capture_output=True, check=True)
+    with tarfile.open(fileobj=io.BytesIO(archive.stdout)) as tar:
+        tar.extractall(dest, filter="data")
+
+
+def run_scale(scale, repeat, code=None):
+    """Results at `scale`x for this tree, or for the tree in `code` (a reference: failing cases are left out)."""
+    with tempfile.TemporaryDirectory(prefix=f"qcs-bench-{scale}x-") as root:
+        make_app(root, scale, code=code)
+        proc = subprocess.run(
+            [sys.executable, "-c", _WORKER, os.path.abspath(__file__), "--worker", "--repeat", str(repeat)]
+            + (["--lenient"] if code else []),
+            cwd=root, capture_output=True, text=True,
+            # Its own shared cache, whatever QCS_CACHE_* the caller has set
+            env={**os.environ, "QCS_TODAY": TODAY, "QCS_CACHE_BACKEND": "sqlite",
+                 "QCS_CACHE_PATH": os.path.join(root, ".cache", "shared.sqlite3")},
+        )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Benchmark at {scale}x failed:\n{proc.stderr[-4000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _each_case(results):
+    for scale, pages in results.items():
+        for page, cases in pages.items():
+            for case, now in cases.items():
+                yield scale, page, case, now
+
+
+def regressions(results, baseline, reference=None):
+    """
+    Human-readable lines for every element count or byte size worse than the
+    baseline allows, and, given a same-host `reference` run, every wall time
+    worse than it allows.
+    """
+    found = []
+    for scale, page, case, now in _each_case(results):
+        base = baseline.get(scale, {}).get(page, {}).get(case)
+        for key in SIZE_METRICS if base is not None else ():
+            if now[key] > base[key] * (1 + SIZE_TOLERANCE):
+                found.append(f"{scale}x {page} / {case}: {now[key]} {key} (baseline {base[key]})")
+        ref = (reference or {}).get(scale, {}).get(page, {}).get(case)
+        if ref is not None and now["ms"] > ref["ms"] * (1 + TIME_TOLERANCE) + TIME_SLACK_MS:
+            found.append(f"{scale}x {page} / {case}: {now['ms']:.0f} ms (reference {ref['ms']:.0f} ms)")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark page renders on synthetic data.")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--repeat", type=int, default=3, help="warm runs per case (median is kept)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--against", metavar="REF", help="also benchmark this git ref now and gate wall times on it")
+    parser.add_argument("--update-baseline", action="store_true", help="store these element counts and sizes as the baseline")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--lenient", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        import streamlit.logger
+
+        streamlit.logger.set_log_level("error")
+        print(json.dumps(run_cases(args.repeat, lenient=args.lenient)))
+        return 0
+
+    results, reference = {}, None
+    with tempfile.TemporaryDirectory(prefix="qcs-bench-ref-") as ref_tree:
+        if args.against:
+            export_ref(args.against, ref_tree)
+            reference = {}
+        for scale in args.scales:
+            if reference is not None:
+                reference[str(scale)] = run_scale(scale, args.repeat, code=ref_tree)
+            results[str(scale)] = run_scale(scale, args.repeat)
+            print(f"\n{scale}x")
+            print(f"  {'page / case':<44}{'ms':>9}{'elements':>10}{'bytes':>11}" + (f"{args.against + ' ms':>14}" if reference else ""))
+            for page, cases in results[str(scale)].items():
+                for case, m in cases.items():
+                    ref = (reference or {}).get(str(scale), {}).get(page, {}).get(case)
+                    print(
+                        f"  {page + ' / ' + case:<44}{m['ms']:>9.1f}{m['elements']:>10}{m['bytes']:>11}"
+                        + (f"{ref['ms']:>14.1f}" if ref else "")
+                    )
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        for scale, pages in results.items():
+            baseline[scale] = {
+                page: {case: {key: m[key] for key in SIZE_METRICS} for case, m in cases.items()}
+                for page, cases in pages.items()
+            }
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    else:
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+    found = regressions(results, baseline, reference)
+    for line in found:
+        print(f"REGRESSION {line}")
+    print(f"\n{len(found)} regression(s)")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
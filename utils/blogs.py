@@ -0,0 +1,291 @@
+import bisect
+import hashlib
+import html
+import json
+import math
+import os
+import re
+import textwrap
+from collections import defaultdict
+
+import streamlit as st
+
+import utils.assets as assets
+import utils.sharedcache as sharedcache
+from utils.helpers import file_version
+
+BLOGS_PATH = "data/blogs.json"
+# Built search indexes are persisted here so a cold start can skip rebuilding
+INDEX_CACHE_PATH = ".cache/blog_search.json"
+
+# Field weights for ranking (BM25F); a hit in the title counts for more than one in the body
+SEARCH_FIELDS = {"title": 3.0, "tag": 2.0, "author": 2.0, "summary": 1.5, "content": 1.0}
+INDEX_FORMAT = 1
+
+_TOKEN_RE = re.compile(r"\w+")
+_MARKDOWN_RE = re.compile(r"[#*_`>\[\]]+")
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(str(text).casefold())
+
+
+# A list item directly under a paragraph line (CommonMark allows this, Python-Markdown needs a blank line)
+_LIST_AFTER_TEXT_RE = re.compile(r"^(?![ \t]*(?:[-*+]|\d+\.)[ \t])([ \t]*\S.*)\n(?=[ \t]*(?:[-*+]|\d+\.)[ \t])", re.MULTILINE)
+
+
+def markdown_html(text):
+    """Markdown -> HTML, dedented first like st.markdown does."""
+    import markdown
+
+    text = _LIST_AFTER_TEXT_RE.sub(r"\1\n\n", textwrap.dedent(text).strip())
+    return markdown.markdown(text, extensions=["extra", "sane_lists"])
+
+
+def citation_card(post, local_url=assets.served_url):
+    """
+    The clickable PDF citation card shown under a post. `local_url` maps a
+    local PDF's path to the URL it is served at (None: no link).
+    """
+    # IEEE Citation format: [1] A. Author, "Title," Source, Month Year. [Online]. Available: URL
+    citation_text = f'[1] {post["author"]}, "{post["title"]}", *Nature Communications*, {post["date"]}. [Online]. Available: {post["pdf_url"]}'
+    # Local PDFs are linked through their static/ copy; a browser cannot fetch assets/ paths
+    url = post["pdf_url"]
+    if os.path.isfile(url):
+        url = local_url(url)
+    link = f'href="{html.escape(url, quote=True)}" target="_blank"' if url else ""
+    return f"""
+                <a {link} style="text-decoration: none; color: inherit;">
+                    <div style="
+                        border: 1px solid #ddd;
+                        border-radius: 8px;
+                        padding: 15px;
+                        background-color: #f9f9f9;
+                        cursor: pointer;
+                        transition: box-shadow 0.3s;
+                    " onmouseover="this.style.boxShadow='0 4px 8px rgba(0,0,0,0.1)'" onmouseout="this.style.boxShadow='none'">
+                        <div style="display: flex; align-items: center;">
+                            <div style="font-size: 24px; margin-right: 15px;">📄</div>
+                            <div>
+                                <div style="font-weight: bold; margin-bottom: 5px; color: #333;">PDF Source</div>
+                                <div style="font-size: 0.9em; color: #555;">
+                                    {citation_text}
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </a>
+                """
+
+
+class BlogStore:
+    """
+    Blog posts for one version of blogs.json: sorted newest first, indexed by
+    id, with each post's page blocks (header, citation card) built once and
+    its body rendered to HTML once, on its first view.
+    """
+
+    def __init__(self, posts, version=None):
+        self.version = version
+        self.posts = sorted(posts, key=lambda p: p['date'], reverse=True)
+        self.by_id = {p['id']: p for p in self.posts}
+        self.ids = [p['id'] for p in self.posts]
+        self.titles = {p['id']: p['title'] for p in self.posts}
+        self.rendered = {p['id']: self._render(p) for p in self.posts}
+        self.tags = sorted({p['tag'] for p in self.posts if p.get('tag')})
+        self._search_index = None
+        self._html = {}
+
+    @property
+    def search_index(self):
+        """Full-text index, loaded from disk or built on first search."""
+        if self._search_index is None:
+            self._search_index = load_search_index(self.posts)
+        return self._search_index
+
+    def content_html(self, post_id):
+        """
+        A post's body as HTML. Rendered on first view rather than at load,
+        so a large blogs.json does not slow the first page view; each worker
+        then renders a post once.
+        """
+        found = self._html.get(post_id)
+        if found is None:
+            found = self._html[post_id] = markdown_html(self.by_id[post_id]['content'])
+        return found
+
+    def search(self, query="", tag=None):
+        """Post ids matching `query` (ranked) and `tag`; newest first when there is no query."""
+        if query.strip():
+            ids = [post_id for post_id, _ in self.search_index.search(query)]
+        else:
+            ids = self.ids
+        if tag:
+            ids = [post_id for post_id in ids if self.by_id[post_id].get('tag') == tag]
+        return ids
+
+    @staticmethod
+    def _render(post):
+        return {
+            "title": f"## {post['title']}",
+            "byline": f"**By {post['author']}** | *{post['date']}* | 🏷️ `{post['tag']}`",
+            "citation": citation_card(post) if 'pdf_url' in post else None,
+        }
+
+    def __len__(self):
+        return len(self.posts)
+
+    def __bool__(self):
+        return bool(self.posts)
+
+
+class SearchIndex:
+    """
+    Inverted index over the blog posts' text fields, ranked with BM25F.
+
+    Postings map token -> [[post position, weighted term frequency], ...].
+    The whole index is plain JSON so it can be persisted between processes.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, data):
+        self.ids = data["ids"]
+        self.postings = data["postings"]
+        self.doc_len = data["doc_len"]
+        self.vocab = sorted(self.postings)
+        n = len(self.ids)
+        self.avg_len = (sum(self.doc_len) / n) if n else 0.0
+        self.idf = {
+            token: math.log(1 + (n - len(plist) + 0.5) / (len(plist) + 0.5))
+            for token, plist in self.postings.items()
+        }
+
+    @classmethod
+    def build(cls, posts):
+        postings = defaultdict(lambda: defaultdict(float))
+        doc_len = []
+        for pos, post in enumerate(posts):
+            length = 0.0
+            for field, weight in SEARCH_FIELDS.items():
+                tokens = tokenize(post.get(field, ""))
+                length += weight * len(tokens)
+                for token in tokens:
+                    postings[token][pos] += weight
+            doc_len.append(length)
+        return cls({
+            "ids": [p['id'] for p in posts],
+            "postings": {t: [[pos, tf] for pos, tf in docs.items()] for t, docs in postings.items()},
+            "doc_len": doc_len,
+        })
+
+    def to_json(self):
+        return {"ids": self.ids, "postings": self.postings, "doc_len": self.doc_len}
+
+    def _expand(self, term, is_last):
+        """Index tokens a query term matches; the last term also matches as a prefix."""
+        if not is_last:
+            return [term] if term in self.postings else []
+        start = bisect.bisect_left(self.vocab, term)
+        end = bisect.bisect_left(self.vocab, term + "\uffff")
+        return self.vocab[start:end]
+
+    def search(self, query, limit=50):
+        """[(post id, score)] best first. Every query term must match."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        scores = None
+        for i, term in enumerate(terms):
+            term_scores = defaultdict(float)
+            for token in self._expand(term, i == len(terms) - 1):
+                idf = self.idf[token]
+                for pos, tf in self.postings[token]:
+                    norm = 1 - self.B + self.B * self.doc_len[pos] / (self.avg_len or 1)
+                    term_scores[pos] += idf * tf * (self.K1 + 1) / (tf + self.K1 * norm)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {pos: s + term_scores[pos] for pos, s in scores.items() if pos in term_scores}
+            if not scores:
+                return []
+        ranked = sorted(scores.items(), key=lambda kv: -kv[1])[:limit]
+        return [(self.ids[pos], score) for pos, score in ranked]
+
+
+def snippet(text, query, width=160):
+    """Escaped excerpt of `text` around the first query hit, with hits in <mark>."""
+    plain = " ".join(_MARKDOWN_RE.sub(" ", str(text)).split())
+    terms = [t for t in tokenize(query) if t]
+    if not terms:
+        return html.escape(plain[:width])
+    pattern = re.compile(r"\b(" + "|".join(re.escape(t) for t in terms) + r")\w*", re.IGNORECASE)
+    match = pattern.search(plain)
+    start = max(0, match.start() - width // 3) if match else 0
+    excerpt = plain[start:start + width]
+    out, last = [], 0
+    for m in pattern.finditer(excerpt):
+        out.append(html.escape(excerpt[last:m.start()]))
+        out.append(f"<mark>{html.escape(m.group(0))}</mark>")
+        last = m.end()
+    out.append(html.escape(excerpt[last:]))
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + width < len(plain) else ""
+    return prefix + "".join(out) + suffix
+
+
+def _content_hash(posts):
+    return hashlib.sha256(json.dumps(posts, sort_keys=True).encode()).hexdigest()
+
+
+def load_search_index(posts, cache_path=INDEX_CACHE_PATH):
+    """
+    SearchIndex for `posts`, read from the on-disk cache when it was built from
+    identical content, otherwise rebuilt and written back.
+    """
+    digest = _content_hash(posts)
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get("format") == INDEX_FORMAT and cached.get("hash") == digest:
+            return SearchIndex(cached["index"])
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = SearchIndex.build(posts)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump({"format": INDEX_FORMAT, "hash": digest, "index": index.to_json()}, f)
+        os.replace(tmp, cache_path)
+    except OSError:
+        # Read-only deployments just rebuild in memory
+        pass
+    return index
+
+
+def read_blogs(path=BLOGS_PATH):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_store(path, version, assets_version):
+    key = sharedcache.content_key(BlogStore, path, assets.MANIFEST_PATH)
+    # The search index is left out; it has its own on-disk cache (INDEX_CACHE_PATH)
+    store = sharedcache.get_or_build("blogs", key, lambda: BlogStore(read_blogs(path)))
+    store.version = version
+    return store
+
+
+def load_blogs(path=BLOGS_PATH):
+    """
+    The BlogStore for the current version of `path`, shared by every session.
+    Also keyed on the asset manifest, since citation cards link fingerprinted PDFs.
+    """
+    return _load_store(path, file_version(path), file_version(assets.MANIFEST_PATH))
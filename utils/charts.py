@@ -0,0 +1,215 @@
+import html
+import logging
+import math
+import threading
+
+import streamlit as st
+
+import utils.sharedcache as sharedcache
+
+logger = logging.getLogger(__name__)
+
+# px.colors.sequential.Bluyl, copied so the SVG fallback needs no Plotly import
+BLUYL = [
+    "rgb(247, 254, 174)", "rgb(183, 230, 165)", "rgb(124, 203, 162)", "rgb(70, 174, 160)",
+    "rgb(8, 144, 153)", "rgb(0, 113, 139)", "rgb(4, 82, 117)",
+]
+FONT_COLORS = {"dark": "#FAFAFA", "light": "#111111"}
+
+# (members version, theme) -> built Plotly figure, shared by every session
+_figures = {}
+_building = set()
+_lock = threading.Lock()
+
+
+def _faculty_figure(labels, values, theme):
+    """Builds the faculty donut with Plotly (the expensive path)."""
+    import plotly.express as px
+
+    fig = px.pie(
+        names=labels,
+        values=values,
+        hole=0.4,
+        color_discrete_sequence=BLUYL,
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color=FONT_COLORS.get(theme, FONT_COLORS["dark"])),
+        showlegend=True,
+    )
+    # Customize traces for nicer hover info
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+
+def _shared_figure(labels, values, theme):
+    """The figure, built once per (counts, theme) across workers."""
+    key = sharedcache.content_key(labels, values, theme)
+    return sharedcache.get_or_build("faculty chart", key, lambda: _faculty_figure(labels, values, theme))
+
+
+def build_faculty_figure(store, theme):
+    """Builds (or fetches) the faculty figure synchronously; used to warm the shared cache."""
+    counts = store.faculty_counts
+    return _shared_figure(counts["Faculty"].tolist(), counts["Count"].tolist(), theme)
+
+
+def _warm(key, labels, values, theme):
+    try:
+        fig = _shared_figure(labels, values, theme)
+    except Exception:
+        logger.exception("Building faculty chart failed")
+        fig = None
+    with _lock:
+        _building.discard(key)
+        if fig is not None:
+            # Only keep figures for the current members file
+            for old in [k for k in _figures if k[0] != key[0]]:
+                del _figures[old]
+            _figures[key] = fig
+
+
+def faculty_figure(store, theme):
+    """
+    The cached Plotly figure for (members version, theme), or None while it is
+    still being built in a background thread.
+    """
+    key = (store.version, theme)
+    with _lock:
+        fig = _figures.get(key)
+        start = fig is None and key not in _building
+        if start:
+            _building.add(key)
+    if start:
+        counts = store.faculty_counts
+        args = (key, counts["Faculty"].tolist(), counts["Count"].tolist(), theme)
+        threading.Thread(target=_warm, args=args, daemon=True).start()
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def donut_svg(labels, values, theme, size=240):
+    """Static SVG donut with a legend; no Plotly needed."""
+    color = FONT_COLORS.get(theme, FONT_COLORS["dark"])
+    total = sum(values) or 1
+    # Ring between 40% and 100% of the radius, like hole=0.4
+    outer = size / 2
+    r = outer * 0.7
+    width = outer * 0.6
+    circumference = 2 * math.pi * r
+
+    arcs, legend, offset = [], [], 0.0
+    for i, (label, value) in enumerate(zip(labels, values)):
+        fill = BLUYL[i % len(BLUYL)]
+        frac = value / total
+        arcs.append(
+            f'<circle r="{r:.2f}" cx="{outer}" cy="{outer}" fill="none" stroke="{fill}" stroke-width="{width:.2f}" '
+            f'stroke-dasharray="{frac * circumference:.2f} {circumference:.2f}" '
+            f'stroke-dashoffset="{-offset * circumference:.2f}"><title>{html.escape(str(label))}: {value}</title></circle>'
+        )
+        legend.append(
+            f'<div style="display:flex;align-items:center;gap:8px;margin:4px 0;">'
+            f'<span style="width:12px;height:12px;border-radius:2px;background:{fill};display:inline-block;"></span>'
+            f'<span>{html.escape(str(label))} ({frac:.1%})</span></div>'
+        )
+        offset += frac
+
+    svg = (
+        f'<svg width="{size}" height="{size}" viewBox="0 0 {size} {size}" role="img" aria-label="Faculty distribution">'
+        f'<g transform="rotate(-90 {outer} {outer})">{"".join(arcs)}</g></svg>'
+    )
+    return (
+        f'<div style="display:flex;flex-wrap:wrap;align-items:center;gap:24px;color:{color};">'
+        f'{svg}<div>{"".join(legend)}</div></div>'
+    )
+
+
+def faculty_distribution(store, theme):
+    """Renders the faculty chart: Plotly once it is warm, the SVG donut until then."""
+    fig = faculty_figure(store, theme)
+    if fig is not None:
+        st.plotly_chart(fig, width="stretch")
+    else:
+        counts = store.faculty_counts
+        st.markdown(
+            donut_svg(tuple(counts["Faculty"].tolist()), tuple(counts["Count"].tolist()), theme),
+            unsafe_allow_html=True,
+        )
+
+
+# --- SURVEY CHARTS (plain HTML; text colour follows the theme) ---
+# Shared by every survey chart; emit once per page, before the charts
+SURVEY_CSS = f"""<style>
+.qcs-bar-row{{display:flex;align-items:center;gap:8px;margin:6px 0}}
+.qcs-bar-label{{flex:0 0 40%;font-size:.9rem}}
+.qcs-bar-track{{flex:1;background:rgba(128,128,128,.15);border-radius:4px;height:18px}}
+.qcs-bar-fill{{display:block;height:100%;border-radius:4px;background:{BLUYL[4]}}}
+.qcs-bar-value{{flex:0 0 70px;text-align:right;font-size:.85rem}}
+.qcs-heatmap{{border-collapse:collapse;color:inherit;width:100%}}
+.qcs-heatmap th,.qcs-heatmap td{{padding:6px;font-size:.8rem;text-align:center}}
+.qcs-heatmap tbody th{{text-align:left}}
+.qcs-heatmap td.qcs-diag{{font-weight:bold}}
+.qcs-legend{{font-size:.85rem;margin-bottom:6px}}
+.qcs-legend span{{display:inline-flex;align-items:center;gap:6px;margin-right:14px}}
+.qcs-swatch{{width:12px;height:12px;border-radius:2px;display:inline-block}}
+.qcs-stack-row{{margin:8px 0;font-size:.9rem}}
+.qcs-stack{{display:flex;height:18px;border-radius:4px;overflow:hidden}}
+</style>"""
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def bars_html(labels, values, total):
+    """Horizontal bars, each labelled with its count and share of `total`."""
+    top = max(values, default=0) or 1
+    rows = "".join(
+        f'<div class="qcs-bar-row"><span class="qcs-bar-label">{html.escape(str(label))}</span>'
+        f'<span class="qcs-bar-track"><span class="qcs-bar-fill" style="width:{value / top:.1%}"></span></span>'
+        f'<span class="qcs-bar-value">{value} ({value / (total or 1):.0%})</span></div>'
+        for label, value in zip(labels, values)
+    )
+    return f"<div>{rows}</div>"
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def heatmap_html(labels, matrix):
+    """Co-occurrence table: cell shade grows with the count; the diagonal is each item's total."""
+    off_diagonal = [v for i, row in enumerate(matrix) for j, v in enumerate(row) if i != j]
+    top = max(off_diagonal, default=0) or 1
+    head = "".join(f"<th>{html.escape(str(l))}</th>" for l in labels)
+    body = "".join(
+        f"<tr><th>{html.escape(str(label))}</th>"
+        + "".join(
+            f'<td class="qcs-diag">{v}</td>' if i == j
+            else f'<td style="background:rgba(0,255,255,{0.08 + 0.6 * v / top:.2f})">{v}</td>'
+            for j, v in enumerate(row)
+        )
+        + "</tr>"
+        for i, (label, row) in enumerate(zip(labels, matrix))
+    )
+    return (
+        '<div style="overflow-x:auto;"><table class="qcs-heatmap">'
+        f"<thead><tr><th></th>{head}</tr></thead><tbody>{body}</tbody></table></div>"
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def stacked_bars_html(rows, segments, counts):
+    """One 100% bar per row, split into `segments` (counts[row][segment]), with a legend."""
+    colors = [BLUYL[(1 + 2 * i) % len(BLUYL)] for i in range(len(segments))]
+    legend = "".join(
+        f'<span><span class="qcs-swatch" style="background:{color}"></span>{html.escape(str(segment))}</span>'
+        for segment, color in zip(segments, colors)
+    )
+    bars = []
+    for row, row_counts in zip(rows, counts):
+        total = sum(row_counts) or 1
+        parts = "".join(
+            f'<span style="width:{n / total:.1%};background:{color}" title="{html.escape(str(segment))}: {n}"></span>'
+            for segment, n, color in zip(segments, row_counts, colors) if n
+        )
+        bars.append(
+            f'<div class="qcs-stack-row">{html.escape(str(row))} ({sum(row_counts)})'
+            f'<div class="qcs-stack">{parts}</div></div>'
+        )
+    return f'<div class="qcs-legend">{legend}</div>{"".join(bars)}'
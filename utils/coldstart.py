@@ -0,0 +1,118 @@
+"""
+Cold-start audit: what each page costs a freshly started worker.
+
+    python -m utils.coldstart [page ...]
+
+Every page is probed in its own interpreter. The probe first imports the
+page's modules on top of a bare `import streamlit`, which must stay cheap and
+must not load any of HEAVY_MODULES. It then times the page's first run, with
+nothing else run before it in that process (not even home.py) and an empty
+shared cache. The command exits non-zero when a page goes over its budget, so it can gate CI
+and deploys.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from utils.helpers import PAGES
+
+# Modules that cost hundreds of ms and must be imported lazily, where they are used
+HEAVY_MODULES = ["pandas", "numpy", "PIL.Image", "plotly.express"]
+
+# Import cost of a page's modules (after streamlit itself), ms
+IMPORT_BUDGET_MS = 250
+# First run of each page in a fresh process, ms (includes building its caches)
+FIRST_RUN_BUDGET_MS = {
+    "home.py": 2500,
+    "pages/02_Events.py": 1000,
+    "pages/03_Community.py": 5000,
+    "pages/04_Blog.py": 1000,
+    "pages/05_About.py": 1000,
+}
+
+_PROBE = r"""
+import ast, json, sys, time, importlib
+page, heavy = sys.argv[1], json.loads(sys.argv[2])
+import streamlit
+loaded = set(sys.modules)
+
+with open(page) as f:
+    tree = ast.parse(f.read())
+names = []
+for node in tree.body:
+    if isinstance(node, ast.Import):
+        names += [a.name for a in node.names]
+    elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+        names.append(node.module)
+names = [n for n in names if n.split(".")[0] != "streamlit"]
+
+start = time.perf_counter()
+for name in names:
+    importlib.import_module(name)
+import_ms = (time.perf_counter() - start) * 1000
+import_heavy = [m for m in heavy if m in sys.modules and m not in loaded]
+
+from streamlit.testing.v1 import AppTest
+# Page links only resolve when the app is started from the main script, but
+# switching before the first run executes only `page`: a visitor's first hit
+at = AppTest.from_file("home.py", default_timeout=60)
+if page != "home.py":
+    at.switch_page(page)
+start = time.perf_counter()
+at.run()
+run_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({
+    "import_ms": import_ms,
+    "import_heavy": import_heavy,
+    "run_ms": run_ms,
+    "exceptions": [e.value for e in at.exception],
+}))
+"""
+
+
+def probe(page):
+    """Measurements for one page from a fresh interpreter, with an empty shared cache."""
+    # A warm .cache/shared.sqlite3 would let the page unpickle what a new
+    # deploy's first worker has to build, so each probe gets its own file
+    with tempfile.TemporaryDirectory(prefix="qcs-coldstart-") as cache_dir:
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE, page, json.dumps(HEAVY_MODULES)],
+            capture_output=True, text=True, timeout=300,
+            env={**os.environ, "QCS_CACHE_PATH": os.path.join(cache_dir, "shared.sqlite3"), "QCS_CACHE_BACKEND": "sqlite"},
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"Probing {page} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def check(page, stats):
+    """Budget violations for one page's measurements."""
+    problems = []
+    if stats["import_ms"] > IMPORT_BUDGET_MS:
+        problems.append(f"imports took {stats['import_ms']:.0f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    if stats["import_heavy"]:
+        problems.append("imports load " + ", ".join(stats["import_heavy"]))
+    budget = FIRST_RUN_BUDGET_MS.get(page)
+    if budget is not None and stats["run_ms"] > budget:
+        problems.append(f"first run took {stats['run_ms']:.0f} ms (budget {budget} ms)")
+    if stats["exceptions"]:
+        problems.append(f"{len(stats['exceptions'])} exception(s) on first run")
+    return problems
+
+
+def main(argv=None):
+    pages = (argv if argv is not None else sys.argv[1:]) or [p["path"] for p in PAGES]
+    failed = False
+    print(f"{'page':<24}{'imports':>10}{'first run':>12}")
+    for page in pages:
+        stats = probe(page)
+        problems = check(page, stats)
+        failed = failed or bool(problems)
+        print(f"{page:<24}{stats['import_ms']:>8.0f}ms{stats['run_ms']:>10.0f}ms  {'; '.join(problems) or 'ok'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import json
+import os
+
+COMMITTEE_PATH = "data/committee.json"
+
+# Card styles for the committee grid
+CARD_CSS = """
+    <style>
+    .committee-card {
+        background-color: rgba(255, 255, 255, 0.05);
+        border: 1px solid rgba(0, 255, 255, 0.1);
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+        height: 100%;
+    }
+    .committee-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 5px 15px rgba(0, 255, 255, 0.2);
+        border-color: #00FFFF;
+    }
+    .committee-img {
+        display: inline-block;
+        width: 100px;
+        height: 100px;
+        border-radius: 50%;
+        background-size: cover;
+        background-position: center;
+        border: 2px solid #00FFFF;
+        margin-bottom: 10px;
+        background-color: #fff; /* Ensure transparent pngs look okay */
+    }
+    .committee-role {
+        color: #00FFFF;
+        font-weight: bold;
+        font-size: 0.9rem;
+        margin-bottom: 5px;
+        height: 40px; /* Fixed height for alignment */
+        display: flex;
+        align-items: center;
+        justify-content: center;
+    }
+    .committee-name {
+        color: #FAFAFA; /* Or inherit */
+        font-size: 1rem;
+        font-weight: 500;
+        margin-bottom: 10px;
+    }
+    .linkedin-block {
+        display: block;
+        margin-top: 10px;
+        padding: 8px 12px;
+        border-radius: 5px;
+        font-size: 0.8rem;
+        font-weight: bold;
+        text-decoration: none;
+        transition: all 0.3s ease;
+        
+        /* Default (Dark Mode) - match theme */
+        background-color: rgba(0, 255, 255, 0.1);
+        border: 1px solid #00FFFF;
+        color: #00FFFF !important;
+    }
+    .linkedin-block:hover {
+        background-color: #00FFFF;
+        color: #000 !important;
+    }
+
+    /* Light Mode Overrides (assuming body background check or media query) */
+    @media (prefers-color-scheme: light) {
+        .linkedin-block {
+            background-color: #ffffff;
+            border: 1px solid #00d4ff; /* Bluish border */
+            color: #000000 !important;
+        }
+        .linkedin-block:hover {
+            background-color: #00d4ff;
+            color: #ffffff !important;
+        }
+    }
+    /* Explicit light mode class if streamlits theme injection is detectable, 
+       but standard media query is safest for system preference. 
+       User said "in light mode", might imply the app theme setting. */
+    </style>
+    """
+
+
+def load_committee(path=COMMITTEE_PATH):
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            return json.load(f)
+    return []
+
+
+def card_html(member, img_class):
+    """One committee card; the whole card links to LinkedIn when a profile is given."""
+    # We construct the inner content first
+    card_content = f"""
+<div class="committee-img {img_class}" role="img" aria-label="{member['name']}"></div>
+<div class="committee-role">{member['role']}</div>
+<div class="committee-name">{member['name']}</div>
+"""
+
+    # Add Link Block if available
+    linkedin_url = member.get('linkedin', '')
+    if not linkedin_url:
+        # Non-clickable card - FLUSH LEFT
+        return f"""
+<div class="committee-card">
+{card_content}
+</div>
+"""
+
+    # Dynamic Link Text
+    if member['name'] == "TBD":
+        link_text = "Follow Us on LinkedIn"
+    else:
+        first_name = member['name'].split()[0]
+        link_text = f"Visit {first_name}'s LinkedIn"
+
+    # Append the styled block - FLUSH LEFT
+    card_content += f"""
+<div class="linkedin-block">
+{link_text}
+</div>
+"""
+
+    # Wrap entire card in A tag for clickability - FLUSH LEFT
+    return f"""
+<a href="{linkedin_url}" target="_blank" style="text-decoration: none; color: inherit; display: block; height: 100%;">
+<div class="committee-card">
+{card_content}
+</div>
+</a>
+"""
@@ -0,0 +1,129 @@
+# Static page copy shared by the Streamlit pages and the static site export (utils/export.py)
+
+# --- HOME ---
+HOME_TAGLINE = """
+        <p style='font-size: 1.2rem; color: #00d4ff; max-width: 800px; margin: 0 auto; line-height: 1.6;'; align="center">
+            Leading the promotion and advocation of Quantum Computing in Africa. <br>
+            Bridging the gap between academia and the quantum revolution.
+        </p>
+        """
+
+HOME_FEATURE_CARDS = [
+    """
+    <div class="feature-card">
+        <div class="card-icon">🎓</div>
+        <div class="card-title">Education & Skills</div>
+        <div class="card-text">
+            Master the Qiskit SDK and quantum algorithms through our <b>Quantum Computing Educational Talks (QCET)</b>.
+            Get access to world-class learning resources and documentation.
+        </div>
+    </div>
+    """,
+    """
+    <div class="feature-card">
+        <div class="card-icon">🤝</div>
+        <div class="card-title">IBM Research Collaboration</div>
+        <div class="card-text">
+            Direct collaboration with <b>IBM Research Africa</b>. 
+            Gain access to real <b>Quantum Hardware</b> (10 mins/month) and mentorship from IBM scientists.
+        </div>
+    </div>
+    """,
+    """
+    <div class="feature-card">
+        <div class="card-icon">🌍</div>
+        <div class="card-title">Community & Events</div>
+        <div class="card-text">
+            Join the <b>Quantum Computing Roundtables</b>, Hackathons, and even Quantum Movie Nights.
+            Connect with industry leaders and like-minded students.
+        </div>
+    </div>
+    """,
+]
+
+HOME_MEMBERSHIP = """
+    Becoming a member of UCT QCS opens the door to the future of computing. 
+    
+    **Registration Fee:** <span class="highlight-text">R150.00</span> / year
+    
+    **Exclusive Benefits:**
+    - ⚛️ **IBM Quantum Access**: Open plan account access to IBM's quantum computers.
+    - 📚 **Learning Platform**: Free access to IBM Quantum Learning courses.
+    - 🗣️ **Seminars**: Annual in-person seminars led by IBM scientists.
+    - 💼 **Career Opportunities**: Internships and co-supervision possibilities.
+    """
+
+HOME_FOOTER = """
+<div class="footer">
+    <div class="social-icons-container">
+        <a href="https://instagram.com" target="_blank" class="social-icon">
+            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="feather feather-instagram"><rect x="2" y="2" width="20" height="20" rx="5" ry="5"></rect><path d="M16 11.37A4 4 0 1 1 12.63 8 4 4 0 0 1 16 11.37z"></path><line x1="17.5" y1="6.5" x2="17.51" y2="6.5"></line></svg>
+        </a>
+        <a href="https://www.linkedin.com/company/uct-qcs" target="_blank" class="social-icon">
+            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="feather feather-linkedin"><path d="M16 8a6 6 0 0 1 6 6v7h-4v-7a2 2 0 0 0-2-2 2 2 0 0 0-2 2v7h-4v-7a6 6 0 0 1 6-6z"></path><rect x="2" y="9" width="4" height="12"></rect><circle cx="4" cy="4" r="2"></circle></svg>
+        </a>
+        <a href="https://www.youtube.com/@UCTQCS" target="_blank" class="social-icon">
+            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="feather feather-youtube"><path d="M22.54 6.42a2.78 2.78 0 0 0-1.94-2C18.88 4 12 4 12 4s-6.88 0-8.6.46a2.78 2.78 0 0 0-1.94 2A29 29 0 0 0 1 11.75a29 29 0 0 0 .46 5.33A2.78 2.78 0 0 0 3.4 19c1.72.46 8.6.46 8.6.46s6.88 0 8.6-.46a2.78 2.78 0 0 0 1.94-2 29 29 0 0 0 .46-5.25 29 29 0 0 0-.46-5.33z"></path><polygon points="9.75 15.02 15.5 11.75 9.75 8.48 9.75 15.02"></polygon></svg>
+        </a>
+    </div>
+    <p>&copy; 2026 UCT Quantum Computing Society.</p>
+</div>
+"""
+
+# --- ABOUT ---
+ABOUT_INTRO = """
+The **UCT Quantum Computing Society** exists to advocate for Quantum Computing in Africa by building an active ecosystem at the University of Cape Town. 
+Our mission is to empower students to become future leaders in the field through education, collaboration, and hands-on exposure to real-world quantum technologies.
+"""
+
+# (expander title, body, expanded by default)
+ABOUT_CONSTITUTION = [
+    ("1. Objectives", """
+    **The objectives of the Society are:**
+    1.  **Build a Community**: Building a strong community of students passionate about quantum and quantum computing.
+    2.  **Foster Learning**: Fostering learning opportunities through meetups, seminars, and hands-on projects.
+    3.  **Engagement**: Facilitating meaningful engagement on discussions related to Quantum and Quantum Computing.
+    4.  **Leadership**: Facilitate the growth of students by building their leadership and networking skills in the field.
+    """, True),
+    ("2. Membership", """
+    *   **Ordinary Members**: Any student of the University or staff member (with committee approval).
+    *   **Honorary Members**: Nominated by the Committee for significant contribution.
+    *   All members submit to the rules and discipline of the Society and the University.
+    """, False),
+    ("3. Committee Structure", """
+    The Committee shall consist of at least five members:
+    *   **Chairperson**
+    *   **Vice-Chairperson**
+    *   **Treasurer**
+    *   **Secretary**
+    *   **Additional Member**
+    
+    Committee members are elected at the **Annual General Meeting (AGM)** held in the third quarter of each year.
+    """, False),
+    ("4. Meetings", """
+    *   **AGM**: Held annually to elect the committee and review reports.
+    *   **General/Special Meetings**: Can be convened by the Committee or by request of members.
+    *   **Quorum**: Generally one-quarter of members, or a sliding scale based on total membership size (e.g., 50 for 200-300 members).
+    """, False),
+    ("5. Affiliation & Amendments", """
+    *   The Society may affiliate with other bodies with approval from the Societies Council.
+    *   The Constitution can only be amended at a meeting with at least two-thirds majority vote.
+    """, False),
+]
+
+ABOUT_FOOTER = """
+<div class="footer">
+    <div class="social-icons-container">
+        <a href="https://instagram.com" target="_blank" class="social-icon">
+            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="feather feather-instagram"><rect x="2" y="2" width="20" height="20" rx="5" ry="5"></rect><path d="M16 11.37A4 4 0 1 1 12.63 8 4 4 0 0 1 16 11.37z"></path><line x1="17.5" y1="6.5" x2="17.51" y2="6.5"></line></svg>
+        </a>
+        <a href="https://linkedin.com" target="_blank" class="social-icon">
+            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="feather feather-linkedin"><path d="M16 8a6 6 0 0 1 6 6v7h-4v-7a2 2 0 0 0-2-2 2 2 0 0 0-2 2v7h-4v-7a6 6 0 0 1 6-6z"></path><rect x="2" y="9" width="4" height="12"></rect><circle cx="4" cy="4" r="2"></circle></svg>
+        </a>
+        <a href="https://youtube.com" target="_blank" class="social-icon">
+            <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="feather feather-youtube"><path d="M22.54 6.42a2.78 2.78 0 0 0-1.94-2C18.88 4 12 4 12 4s-6.88 0-8.6.46a2.78 2.78 0 0 0-1.94 2A29 29 0 0 0 1 11.75a29 29 0 0 0 .46 5.33A2.78 2.78 0 0 0 3.4 19c1.72.46 8.6.46 8.6.46s6.88 0 8.6-.46a2.78 2.78 0 0 0 1.94-2 29 29 0 0 0 .46-5.25 29 29 0 0 0-.46-5.33z"></path><polygon points="9.75 15.02 15.5 11.75 9.75 8.48 9.75 15.02"></polygon></svg>
+        </a>
+    </div>
+    <p>&copy; 2026 UCT Quantum Computing Society.</p>
+</div>
+"""
@@ -0,0 +1,207 @@
+import bisect
+import calendar
+import datetime
+import html
+import json
+import logging
+import os
+from collections import defaultdict
+
+import streamlit as st
+
+import utils.recurrence as recurrence
+import utils.sharedcache as sharedcache
+from utils.helpers import file_version
+
+EVENTS_PATH = "data/events.json"
+DAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+# Distinct `upcoming` queries remembered per index
+MAX_CACHED_QUERIES = 64
+# Open-ended series count as running this long past their start in date_range()
+OPEN_ENDED_HORIZON = datetime.timedelta(days=365)
+# Pins "today" (ISO date) so benchmarks render the same month whenever they run
+TODAY_ENV = "QCS_TODAY"
+
+logger = logging.getLogger(__name__)
+
+
+def today():
+    """The current date, or the date in $QCS_TODAY when it is set."""
+    pinned = os.environ.get(TODAY_ENV)
+    return datetime.date.fromisoformat(pinned) if pinned else datetime.date.today()
+
+
+class EventIndex:
+    """
+    Events from events.json bucketed by month and day, built once per file version.
+
+    Events are plain dicts with `date` parsed to a datetime.date, so month
+    views are dictionary lookups with no DataFrame work. Records with an
+    `rrule` are kept as recurrence.Series and only expanded for the months
+    that are asked for. A sorted (date, time) timeline per type answers
+    "next N events" across months with a bisect.
+    """
+
+    def __init__(self, events, version=None):
+        self.version = version
+        self.events = []
+        self.series = []
+        months = defaultdict(lambda: defaultdict(list))
+        month_lists = defaultdict(list)
+        for raw in events:
+            if raw.get("rrule"):
+                try:
+                    self.series.append(recurrence.Series(raw))
+                    continue
+                except (ValueError, KeyError):
+                    logger.warning("Event %s has an invalid rrule; showing its first date only", raw.get("id"), exc_info=True)
+            event = dict(raw)
+            event["date"] = datetime.date.fromisoformat(str(raw["date"])[:10])
+            self.events.append(event)
+        self.events.sort(key=_sort_key)
+        for event in self.events:
+            d = event["date"]
+            months[(d.year, d.month)][d.day].append(event)
+            month_lists[(d.year, d.month)].append(event)
+        self._months = {key: dict(days) for key, days in months.items()}
+        self._month_lists = dict(month_lists)
+        self._merged = {}
+
+        # Timeline of one-off events: None -> all of them, type -> that type's, as (keys, events).
+        # Untyped events are only in the None timeline, which is a copy so the loop never grows it.
+        self._timeline = {None: ([_sort_key(e) for e in self.events], list(self.events))}
+        for event in self.events:
+            if not event.get("type"):
+                continue
+            keys, typed = self._timeline.setdefault(event["type"], ([], []))
+            keys.append(_sort_key(event))
+            typed.append(event)
+        self._upcoming = {}
+
+    def _expand(self, year, month):
+        """(by day, in order) for a month, with series occurrences merged in (memoized)."""
+        key = (year, month)
+        found = self._merged.get(key)
+        if found is None:
+            events = list(self._month_lists.get(key, []))
+            for series in self.series:
+                events += series.month(year, month)
+            events.sort(key=_sort_key)
+            by_day = defaultdict(list)
+            for event in events:
+                by_day[event["date"].day].append(event)
+            if len(self._merged) >= recurrence.MAX_CACHED_MONTHS:
+                self._merged.clear()
+            found = self._merged[key] = (dict(by_day), events)
+        return found
+
+    def month(self, year, month):
+        """{day: [events]} for one month (empty dict if nothing is on)."""
+        if not self.series:
+            return self._months.get((year, month), {})
+        return self._expand(year, month)[0]
+
+    def month_events(self, year, month):
+        """All events in a month, in date order."""
+        if not self.series:
+            return self._month_lists.get((year, month), [])
+        return self._expand(year, month)[1]
+
+    def upcoming(self, after, limit=3, types=None):
+        """
+        The next `limit` events on or after the date `after`, across months
+        and years, optionally only of `types`. One-offs come from a bisect
+        on the timeline; each series contributes its next occurrences.
+        """
+        types = frozenset(types) if types else None
+        query = (after, limit, types)
+        found = self._upcoming.get(query)
+        if found is None:
+            found = []
+            for bucket in ([None] if types is None else types):
+                keys, events = self._timeline.get(bucket, ([], []))
+                start = bisect.bisect_left(keys, (after, ""))
+                found += events[start:start + limit]
+            for series in self.series:
+                if types is None or series.record.get("type") in types:
+                    found += series.upcoming(after, limit)
+            found = sorted(found, key=_sort_key)[:limit]
+            if len(self._upcoming) >= MAX_CACHED_QUERIES:
+                self._upcoming.clear()
+            self._upcoming[query] = found
+        return found
+
+    @property
+    def types(self):
+        """Event types in use, sorted."""
+        return sorted({t for t in self._timeline if t} | {s.record["type"] for s in self.series if s.record.get("type")})
+
+    def date_range(self):
+        """(first, last) date of anything scheduled, or None if nothing is."""
+        firsts = [e["date"] for e in self.events[:1]] + [s.start for s in self.series]
+        lasts = [e["date"] for e in self.events[-1:]] + [s.last or s.start + OPEN_ENDED_HORIZON for s in self.series]
+        return (min(firsts), max(lasts)) if firsts else None
+
+    def __len__(self):
+        return len(self.events) + len(self.series)
+
+
+def _sort_key(event):
+    return event["date"], event.get("time", "")
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _calendar_html(_index, version, year, month, today):
+    cells = [f'<div class="calendar-header">{name}</div>' for name in DAY_NAMES]
+    events_by_day = _index.month(year, month)
+    for week in calendar.monthcalendar(year, month):
+        for day in week:
+            if day == 0:
+                cells.append('<div class="calendar-day empty"></div>')
+                continue
+            today_class = " current-day" if datetime.date(year, month, day) == today else ""
+            markers = "".join(
+                f'<div class="event-marker {html.escape(str(e["type"]))}" title="{html.escape(e["title"])}">'
+                f'{html.escape(e["title"])}</div>'
+                for e in events_by_day.get(day, [])
+            )
+            cells.append(f'<div class="calendar-day{today_class}"><div class="day-number">{day}</div>{markers}</div>')
+    return f'<div class="calendar-container">{"".join(cells)}</div>'
+
+
+def calendar_html(index, year, month, today):
+    """
+    The whole month grid as one HTML block (styled by .calendar-* classes in
+    the theme stylesheets), cached per (events version, year, month, today).
+    The markup is theme-independent, so both themes share one entry.
+    """
+    return _calendar_html(index, index.version, year, month, today)
+
+
+def teaser_html(event):
+    """A compact card for one upcoming event (home page)."""
+    return (
+        f'<div class="feature-card"><div class="card-title">{html.escape(event["title"])}</div>'
+        f'<div class="card-text">🗓️ {event["date"].strftime("%a %d %b")} · {html.escape(str(event.get("time", "")))}<br>'
+        f'📍 {html.escape(str(event.get("location", "")))}</div></div>'
+    )
+
+
+def read_events(path=EVENTS_PATH):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_index(path, version):
+    index = sharedcache.get_or_build("events", sharedcache.content_key(EventIndex, recurrence.Series, path), lambda: EventIndex(read_events(path)))
+    index.version = version
+    return index
+
+
+def load_index(path=EVENTS_PATH):
+    """The EventIndex for the current version of `path`, shared by every session."""
+    return _load_index(path, file_version(path))
@@ -0,0 +1,431 @@
+"""
+Static export of the read-only pages.
+
+    python -m utils.export [--out site] [--theme light|dark] [--app-url URL] [--force]
+
+Renders Home, Events (one page per month), Community (committee and member
+stats), Blog (one page per post) and About to plain HTML from the same
+data/ files and theme CSS the Streamlit app uses. Each page records a hash
+of its inputs in the output's manifest and is only rewritten when one of
+them changes. Sign-up and contact stay in the Streamlit app (`--app-url`).
+"""
+import argparse
+import calendar
+import functools
+import hashlib
+import html
+import json
+import logging
+import os
+import shutil
+import urllib.parse
+
+import streamlit as st
+import streamlit.logger
+
+import utils.avatars as avatars
+import utils.blogs as blogs
+import utils.charts as charts
+import utils.committee as committee
+import utils.content as content
+import utils.events as events
+import utils.feeds as feeds
+import utils.members as members
+import utils.recurrence as recurrence
+import utils.sharedcache as sharedcache
+import utils.styles as styles
+import utils.survey as survey
+from utils.files import file_version
+
+OUT_DIR = "site"
+MANIFEST_NAME = ".manifest.json"
+
+# Templates: a change to any of these rebuilds every page
+TEMPLATE_FILES = [
+    __file__, content.__file__, committee.__file__, events.__file__, feeds.__file__, recurrence.__file__, survey.__file__,
+    blogs.__file__, charts.__file__, avatars.__file__,
+]
+# Files copied verbatim into <out>/assets
+STATIC_ASSETS = ["assets/logo.png", "assets/quantum_chandelier.png"]
+
+NAV = [
+    ("Home", "index.html"),
+    ("Events", "events/index.html"),
+    ("Community", "community.html"),
+    ("Blog", "blog/index.html"),
+    ("About", "about.html"),
+]
+
+# Layout for the pieces Streamlit normally provides (columns, nav, expanders)
+LAYOUT_CSS = """
+body{margin:0;font-family:"Source Sans Pro",sans-serif}
+main{max-width:1200px;margin:0 auto;padding:1rem 2rem 3rem}
+.site-nav{display:flex;flex-wrap:wrap;justify-content:center;gap:.5rem;padding:1rem;border-bottom:1px solid rgba(128,128,128,.3)}
+.site-nav a{padding:.5rem 1rem;border-radius:8px;text-decoration:none;color:inherit;font-weight:600}
+.site-nav a.active{background:rgba(0,212,255,.15);color:#00d4ff}
+.columns{display:grid;grid-template-columns:repeat(auto-fit,minmax(240px,1fr));gap:1.5rem}
+.columns-4{grid-template-columns:repeat(auto-fit,minmax(200px,1fr))}
+.hero{text-align:center;padding:3rem 1rem;margin-bottom:2rem}
+.month-nav{display:flex;justify-content:space-between;margin:1rem 0}
+.cta-link{display:inline-block;margin-top:1rem;padding:.6rem 1.4rem;border-radius:8px;background:#00d4ff;color:#000;font-weight:700;text-decoration:none}
+details{border:1px solid rgba(128,128,128,.3);border-radius:8px;padding:.5rem 1rem;margin:.5rem 0}
+summary{cursor:pointer;font-weight:600}
+img{max-width:100%;height:auto}
+"""
+
+
+def _file_digest(path):
+    version = file_version(path)
+    return None if version is None else _content_digest(path, version)
+
+
+@functools.lru_cache(maxsize=1024)
+def _content_digest(path, version):
+    """sha256 of a file's content. `version` keys the cache, so an edited file is re-hashed."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class Site:
+    """Output directory plus the manifest of input hashes for each written page."""
+
+    def __init__(self, out_dir, theme, app_url=None, force=False):
+        self.out_dir = out_dir
+        self.theme = theme
+        self.app_url = app_url.rstrip("/") if app_url else None
+        self.force = force
+        self.written = []
+        self.skipped = []
+        self._manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+        try:
+            with open(self._manifest_path, "r") as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            self.manifest = {}
+        self._template_key = [_file_digest(p) for p in TEMPLATE_FILES] + [theme, self.app_url]
+
+    def _key(self, inputs, params):
+        payload = json.dumps([self._template_key, [(p, _file_digest(p)) for p in inputs], params], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _write(self, rel_path, data):
+        path = os.path.join(self.out_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def page(self, rel_path, inputs, render, params=None):
+        """Writes `render()` to `rel_path` unless its inputs are unchanged since the last export."""
+        key = self._key(inputs, params)
+        if not self.force and self.manifest.get(rel_path) == key and os.path.exists(os.path.join(self.out_dir, rel_path)):
+            self.skipped.append(rel_path)
+            return
+        data = render()
+        self._write(rel_path, data if isinstance(data, bytes) else data.encode("utf-8"))
+        self.manifest[rel_path] = key
+        self.written.append(rel_path)
+
+    def asset(self, src, rel_path=None):
+        rel_path = rel_path or src
+        with open(src, "rb") as f:
+            data = f.read()
+        self.page(rel_path, [src], lambda: data, params="asset")
+
+    def save_manifest(self):
+        self._write(MANIFEST_NAME, json.dumps(self.manifest, indent=2, sort_keys=True).encode())
+
+    def layout(self, rel_path, title, body, active=None):
+        root = "../" * rel_path.count("/")
+        nav = "".join(
+            f'<a href="{root}{href}" class="active">{label}</a>' if label == active else f'<a href="{root}{href}">{label}</a>'
+            for label, href in NAV
+        )
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<link rel="icon" href="{root}assets/logo.png">
+<link rel="stylesheet" href="{root}assets/{os.path.basename(styles.THEME_FILES[self.theme])}">
+<style>{LAYOUT_CSS}</style>
+</head>
+<body class="stApp">
+<nav class="site-nav">{nav}</nav>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+    def app_link(self, page, label):
+        if not self.app_url:
+            return ""
+        return f'<a class="cta-link" href="{html.escape(f"{self.app_url}/{page}", quote=True)}">{label}</a>'
+
+
+# --- PAGES ---
+def render_home(site):
+    features = "".join(f"<div>{card}</div>" for card in content.HOME_FEATURE_CARDS)
+    body = f"""
+<section class="hero">
+<img src="assets/logo.png" alt="UCT QCS logo" width="150">
+<h1 class="hero-title" align="center">Quantum Computing Society</h1>
+<p class="hero-subtitle" align="center">University of Cape Town</p>
+{content.HOME_TAGLINE}
+</section>
+<h3>Why Join UCT QCS?</h3>
+<div class="columns">{features}</div>
+<hr><br>
+<div class="columns">
+<div><img src="assets/quantum_chandelier.png" alt="Quantum chandelier"></div>
+<div>
+<h3>Membership Details</h3>
+{blogs.markdown_html(content.HOME_MEMBERSHIP)}
+{site.app_link("Community", "Become a Member")}
+</div>
+</div>
+{content.HOME_FOOTER}
+"""
+    return site.layout("index.html", "UCT QCS", body, "Home")
+
+
+def _month_path(year, month):
+    return f"events/{year}-{month:02d}.html"
+
+
+def _event_months(index):
+    """Every (year, month) from the first event's month to the last one's."""
+    span = index.date_range()
+    if span is None:
+        return []
+    first, last = span
+    months, (y, m) = [], (first.year, first.month)
+    while (y, m) <= (last.year, last.month):
+        months.append((y, m))
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return months
+
+
+def _event_html(event):
+    return f"""
+<details open>
+<summary>{html.escape(event['title'])} ({html.escape(event.get('time', ''))}) - {event['date'].day} {calendar.month_abbr[event['date'].month]}</summary>
+<p><b>📍 Location:</b> {html.escape(event.get('location', ''))}</p>
+<p><b>📝 Description:</b> {html.escape(event.get('description', ''))}</p>
+<p><b>🏷️ Type:</b> {html.escape(str(event.get('type', '')))}</p>
+</details>"""
+
+
+def render_event_month(site, index, months, i):
+    year, month = months[i]
+    rel_path = _month_path(year, month)
+    prev_link = f'<a href="{os.path.basename(_month_path(*months[i - 1]))}">&larr; {calendar.month_name[months[i - 1][1]]}</a>' if i > 0 else "<span></span>"
+    next_link = f'<a href="{os.path.basename(_month_path(*months[i + 1]))}">{calendar.month_name[months[i + 1][1]]} &rarr;</a>' if i + 1 < len(months) else "<span></span>"
+    month_events = index.month_events(year, month)
+    details = "".join(_event_html(e) for e in month_events) or "<p>No events scheduled for this month.</p>"
+    body = f"""
+<h1>📅 QCS Events Calendar</h1>
+<h2>{calendar.month_name[month]} {year}</h2>
+<div class="month-nav">{prev_link}{next_link}</div>
+{events.calendar_html(index, year, month, None)}
+<hr>
+<h3>Events this month</h3>
+{details}
+"""
+    return site.layout(rel_path, f"QCS Events - {calendar.month_name[month]} {year}", body, "Events")
+
+
+def render_event_index(site, index, months):
+    feed_types = sorted({e["type"] for e in index.events + [s.record for s in index.series] if e.get("type")})
+    feed_links = " · ".join(
+        [f'<a href="../feeds/{feeds.feed_name()}.ics">All events</a>']
+        + [f'<a href="../feeds/{feeds.feed_name(t)}.ics">{html.escape(t)}</a>' for t in feed_types]
+        + [f'<a href="../feeds/{feeds.feed_name()}.json">JSON</a>']
+    )
+    items = "".join(
+        f'<li><a href="{os.path.basename(_month_path(y, m))}">{calendar.month_name[m]} {y}</a> '
+        f'({len(index.month_events(y, m))} events)</li>'
+        for y, m in months
+    )
+    body = f"""
+<h1>📅 QCS Events Calendar</h1>
+<p>Stay up to date with the latest workshops, hackathons, and socials.</p>
+<p>📆 Add to your calendar (.ics): {feed_links}</p>
+<ul>{items}</ul>
+"""
+    return site.layout("events/index.html", "QCS Events", body, "Events")
+
+
+def _survey_html(stats):
+    if not stats.respondents:
+        return ""
+
+    def bars(title, counts):
+        if not counts:
+            return ""
+        labels, values = zip(*counts)
+        return f"<div><h4>{title}</h4>{charts.bars_html(labels, values, stats.respondents)}</div>"
+
+    levels = charts.stacked_bars_html(tuple(stats.faculties), tuple(stats.levels), tuple(map(tuple, stats.level_counts)))
+    matrix = charts.heatmap_html(tuple(stats.matrix_labels), tuple(map(tuple, stats.matrix)))
+    return f"""
+<h3>🔬 Interests &amp; Experience</h3>
+{charts.SURVEY_CSS}
+<div class="columns">{bars("What members want to learn", stats.interests)}<div><h4>Experience by faculty</h4>{levels}</div></div>
+<details><summary>Which interests go together?</summary>{matrix}</details>
+<div class="columns">{bars("Why members joined", stats.reasons)}{bars("Roles members would take on", stats.roles)}</div>
+"""
+
+
+def render_community(site):
+    df = members.read_members()
+    parts = ["<h1>👥 Community Dashboard</h1>"]
+    if not df.empty:
+        counts = df["Faculty"].value_counts()
+        parts.append(f"""
+<div style="text-align: center; margin-bottom: 30px;">
+    <h2 style="margin:0; font-size: 2rem; color: #b0b0b0;">Total Members</h2>
+    <h1 style="margin:0; font-size: 6rem; font-weight: 900; background: linear-gradient(90deg, #00FFFF, #9D00FF); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{len(df)}</h1>
+</div>
+<h3>📊 Faculty Distribution</h3>
+{charts.donut_svg(tuple(counts.index.astype(str)), tuple(int(c) for c in counts), site.theme)}
+""")
+        parts.append(_survey_html(survey.build_stats()))
+    parts.append("<h3>👔 QCS Committee 2026</h3>")
+    committee_data = committee.load_committee()
+    if committee_data:
+        cards = "".join(
+            f"<div>{committee.card_html(m, avatars.avatar_class(m['image']))}</div>" for m in committee_data
+        )
+        parts.append(committee.CARD_CSS + avatars.avatar_css([m['image'] for m in committee_data]))
+        parts.append(f'<div class="columns columns-4">{cards}</div>')
+    else:
+        parts.append("<p>Committee information coming soon.</p>")
+    parts.append(site.app_link("Community", "Join QCS"))
+    return site.layout("community.html", "QCS Community", "\n".join(parts), "Community")
+
+
+def render_blog_index(site, store):
+    items = "".join(
+        f'<article><h3><a href="{html.escape(str(p["id"]))}.html">{html.escape(p["title"])}</a></h3>'
+        f'{blogs.markdown_html(store.rendered[p["id"]]["byline"])}<p>{html.escape(p.get("summary", ""))}</p></article>'
+        for p in store.posts
+    ) or "<p>No blog posts yet. Stay tuned!</p>"
+    body = f"<h1>📰 QCS Research Highlights</h1>\n{items}"
+    return site.layout("blog/index.html", "QCS Blog", body, "Blog")
+
+
+def _local_pdfs(store):
+    """Local PDFs the posts cite; export() copies them into the site under the same path."""
+    return sorted({p["pdf_url"] for p in store.posts if p.get("pdf_url") and os.path.isfile(p["pdf_url"])})
+
+
+def render_blog_post(site, store, post_id):
+    block = store.rendered[post_id]
+    post = store.by_id[post_id]
+    # The app's card links /app/static/; here the PDF is a copy next to the pages
+    citation = blogs.citation_card(post, lambda path: "../" + urllib.parse.quote(path)) if "pdf_url" in post else ""
+    body = "\n".join([
+        blogs.markdown_html(block["title"]),
+        blogs.markdown_html(block["byline"]),
+        "<hr>",
+        store.content_html(post_id),
+        citation,
+        '<p><a href="index.html">&larr; All posts</a></p>',
+    ])
+    return site.layout(f"blog/{post_id}.html", store.titles[post_id], body, "Blog")
+
+
+def render_about(site):
+    sections = "".join(
+        f"<details{' open' if expanded else ''}><summary>{html.escape(title)}</summary>{blogs.markdown_html(text)}</details>"
+        for title, text, expanded in content.ABOUT_CONSTITUTION
+    )
+    body = f"""
+<h1>ℹ️ About UCT QCS</h1>
+{blogs.markdown_html(content.ABOUT_INTRO)}
+<hr>
+<h2>📜 QCS Constitution Overview</h2>
+<p>Below are the key directives from our Society's Constitution.</p>
+{sections}
+<hr>
+<h2>📬 Contact Us</h2>
+<p>Have questions or want to collaborate? Email <a href="mailto:uctqcs@gmail.com">uctqcs@gmail.com</a>.</p>
+{site.app_link("About", "Contact form")}
+{content.ABOUT_FOOTER}
+"""
+    return site.layout("about.html", "About QCS", body, "About")
+
+
+def export(out_dir=OUT_DIR, theme="light", app_url=None, force=False):
+    """Builds the static site into `out_dir`; returns the Site with written/skipped pages."""
+    site = Site(out_dir, theme, app_url, force)
+    theme_css = styles.THEME_FILES[theme]
+    site.asset(theme_css, f"assets/{os.path.basename(theme_css)}")
+    for path in STATIC_ASSETS:
+        site.asset(path)
+
+    site.page("index.html", [], lambda: render_home(site))
+
+    # Versioned like the app's index, so calendar_html never reuses a month rendered from other data
+    index = events.EventIndex(events.read_events(), version=sharedcache.content_key(events.EVENTS_PATH))
+    months = _event_months(index)
+    site.page("events/index.html", [events.EVENTS_PATH], lambda: render_event_index(site, index, months))
+    # Feeds keep their own manifest (per-event stamps), so they are not tracked as pages
+    feeds.build(events.EVENTS_PATH, os.path.join(out_dir, "feeds"), force)
+    for i in range(len(months)):
+        site.page(_month_path(*months[i]), [events.EVENTS_PATH], lambda: render_event_month(site, index, months, i), params=months[i])
+
+    committee_data = committee.load_committee()
+    site.page(
+        "community.html",
+        [members.MEMBERS_PATH, committee.COMMITTEE_PATH] + [m['image'] for m in committee_data],
+        lambda: render_community(site),
+    )
+
+    store = blogs.BlogStore(blogs.read_blogs())
+    for path in _local_pdfs(store):
+        site.asset(path)
+    site.page("blog/index.html", [blogs.BLOGS_PATH], lambda: render_blog_index(site, store))
+    for post_id in store.ids:
+        site.page(f"blog/{post_id}.html", [blogs.BLOGS_PATH], lambda: render_blog_post(site, store, post_id), params=post_id)
+
+    site.page("about.html", [], lambda: render_about(site))
+
+    # Drop pages that no longer exist (e.g. a deleted post or month)
+    current = set(site.written) | set(site.skipped)
+    for rel_path in [p for p in site.manifest if p not in current]:
+        try:
+            os.remove(os.path.join(out_dir, rel_path))
+        except FileNotFoundError:
+            pass
+        del site.manifest[rel_path]
+    site.save_manifest()
+    return site
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the read-only pages as a static site.")
+    parser.add_argument("--out", default=OUT_DIR, help="output directory (default: %(default)s)")
+    parser.add_argument("--theme", default="light", choices=sorted(styles.THEME_FILES))
+    parser.add_argument("--app-url", help="URL of the Streamlit app, linked for sign-up and contact")
+    parser.add_argument("--force", action="store_true", help="rebuild every page")
+    parser.add_argument("--clean", action="store_true", help="delete the output directory first")
+    args = parser.parse_args(argv)
+
+    # The loaders are st.cache_* functions; outside `streamlit run` they warn on
+    # every call. Reading the config first keeps it from resetting the level later.
+    st.get_option("logger.level")
+    streamlit.logger.set_log_level(logging.ERROR)
+    if args.clean:
+        shutil.rmtree(args.out, ignore_errors=True)
+    site = export(args.out, args.theme, args.app_url, args.force)
+    print(f"Exported to {args.out}: {len(site.written)} written, {len(site.skipped)} unchanged")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+iCalendar and JSON feeds of data/events.json, served as static files.
+
+    python -m utils.feeds [--force]
+
+Writes static/feeds/events.ics and events.json, plus events-<type>.ics/.json
+for each event type. Calendar clients then poll files served by Streamlit's
+static handler (or a proxy in front of it), with ETags, and never run a page.
+Nothing is rendered when events.json is unchanged. A feed file is only
+rewritten when its own bytes change, so its ETag stays valid until then.
+Each event's DTSTAMP/LAST-MODIFIED is the time its record last changed
+(kept in static/feeds/manifest.json), not the build time.
+"""
+import argparse
+import datetime
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+
+import streamlit as st
+
+import utils.assets as assets
+import utils.recurrence as recurrence
+from utils.files import file_version
+
+EVENTS_PATH = "data/events.json"
+FEEDS_DIR = os.path.join(assets.STATIC_DIR, "feeds")
+FEEDS_URL = assets.STATIC_URL + "feeds/"
+FORMAT = 1
+
+CALENDAR_NAME = "UCT QCS Events"
+UID_DOMAIN = "uctqcs.events"
+# Cape Town has no daylight saving, so one STANDARD block describes it fully
+TZID = "Africa/Johannesburg"
+UTC_OFFSET = datetime.timedelta(hours=2)
+VTIMEZONE = [
+    "BEGIN:VTIMEZONE",
+    f"TZID:{TZID}",
+    "BEGIN:STANDARD",
+    "DTSTART:19700101T000000",
+    "TZOFFSETFROM:+0200",
+    "TZOFFSETTO:+0200",
+    "TZNAME:SAST",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+]
+
+logger = logging.getLogger(__name__)
+
+_TIME_RANGE_RE = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*(?:-\s*(\d{1,2}):(\d{2}))?\s*$")
+
+
+def feed_name(event_type=None):
+    """File stem for the full feed, or the feed of one event type."""
+    if event_type is None:
+        return "events"
+    slug = re.sub(r"[^a-z0-9]+", "-", str(event_type).lower()).strip("-")
+    return f"events-{slug}"
+
+
+def _times(event):
+    """(start, end) datetimes in local time, or None for an all-day event."""
+    match = _TIME_RANGE_RE.match(str(event.get("time", "")))
+    if not match:
+        return None
+    day = datetime.date.fromisoformat(str(event["date"])[:10])
+    start = datetime.datetime.combine(day, datetime.time(int(match[1]), int(match[2])))
+    end = start + datetime.timedelta(hours=1)
+    if match[3]:
+        end = datetime.datetime.combine(day, datetime.time(int(match[3]), int(match[4])))
+        if end <= start:
+            end += datetime.timedelta(days=1)
+    return start, end
+
+
+def _event_digest(event):
+    return hashlib.sha256(json.dumps(event, sort_keys=True, default=str).encode()).hexdigest()
+
+
+# --- ICS ---
+def _escape(text):
+    return (
+        str(text).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line):
+    """Splits a content line into 75-octet pieces (RFC 5545 3.1), never inside a UTF-8 character."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line
+    parts, start, limit = [], 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        while end < len(data) and (data[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode("utf-8"))
+        start, limit = end, 74  # continuation lines start with a space
+    return "\r\n ".join(parts)
+
+
+def _utc_stamp(stamp):
+    return datetime.datetime.fromtimestamp(stamp, datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _start_value(event, day):
+    """DTSTART-style property suffix for `event` on `day` (timed or all-day)."""
+    times = _times(dict(event, date=day.isoformat()))
+    return f";TZID={TZID}:{times[0]:%Y%m%dT%H%M%S}" if times else f";VALUE=DATE:{day:%Y%m%d}"
+
+
+def _vevent(event, stamp, recurrence_id=None):
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:event-{event['id']}@{UID_DOMAIN}",
+        f"DTSTAMP:{_utc_stamp(stamp)}",
+        f"LAST-MODIFIED:{_utc_stamp(stamp)}",
+    ]
+    if recurrence_id is not None:
+        lines.append(f"RECURRENCE-ID{recurrence_id}")
+    times = _times(event)
+    if times:
+        start, end = times
+        lines.append(f"DTSTART;TZID={TZID}:{start:%Y%m%dT%H%M%S}")
+        lines.append(f"DTEND;TZID={TZID}:{end:%Y%m%dT%H%M%S}")
+    else:
+        day = datetime.date.fromisoformat(str(event["date"])[:10])
+        lines.append(f"DTSTART;VALUE=DATE:{day:%Y%m%d}")
+        lines.append(f"DTEND;VALUE=DATE:{day + datetime.timedelta(days=1):%Y%m%d}")
+    series = _series(event) if recurrence_id is None else None
+    if series is not None:
+        lines.append(f"RRULE:{series.ics_rrule(UTC_OFFSET)}")
+        for day in sorted(series.cancelled):
+            lines.append(f"EXDATE{_start_value(event, day)}")
+    lines.append(f"SUMMARY:{_escape(event.get('title', ''))}")
+    if event.get("location"):
+        lines.append(f"LOCATION:{_escape(event['location'])}")
+    if event.get("description"):
+        lines.append(f"DESCRIPTION:{_escape(event['description'])}")
+    if event.get("type"):
+        lines.append(f"CATEGORIES:{_escape(event['type'])}")
+    lines.append("END:VEVENT")
+    # Changed occurrences follow the series as VEVENTs with the same UID
+    for day, fields in sorted(series.overrides.items()) if series is not None else ():
+        if day not in series.cancelled:
+            changed = dict(event)
+            changed.update(fields)
+            changed["date"] = day.isoformat()
+            changed.pop("rrule", None)
+            lines += _vevent(changed, stamp, recurrence_id=_start_value(event, day))
+    return lines
+
+
+def _series(event):
+    """recurrence.Series for a repeating record; None for one-offs or an invalid rule."""
+    if not event.get("rrule"):
+        return None
+    try:
+        return recurrence.Series(event)
+    except (ValueError, KeyError):
+        return None
+
+
+def render_ics(events, stamps, title=CALENDAR_NAME):
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//UCT Quantum Computing Society//Events//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(title)}",
+        f"X-WR-TIMEZONE:{TZID}",
+        *VTIMEZONE,
+    ]
+    for event in events:
+        lines += _vevent(event, stamps[str(event["id"])])
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(_fold(line) for line in lines) + "\r\n").encode("utf-8")
+
+
+# --- JSON ---
+def _json_event(event):
+    times = _times(event)
+    tz = datetime.timezone(UTC_OFFSET)
+    if times:
+        start, end = (t.replace(tzinfo=tz).isoformat() for t in times)
+    else:
+        start = end = str(event["date"])[:10]
+    out = {
+        "id": event["id"],
+        "title": event.get("title", ""),
+        "start": start,
+        "end": end,
+        "allDay": times is None,
+        "location": event.get("location", ""),
+        "type": event.get("type", ""),
+        "description": event.get("description", ""),
+    }
+    # Series stay one record (first occurrence + rule), as in the .ics feed
+    for key in ("rrule", "cancelled", "overrides"):
+        if event.get(key):
+            out[key] = event[key]
+    return out
+
+
+def render_json(events, title=CALENDAR_NAME):
+    payload = {"name": title, "timezone": TZID, "events": [_json_event(e) for e in events]}
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# --- BUILD ---
+def _read_manifest(path):
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+        return manifest if manifest.get("format") == FORMAT else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_if_changed(path, data):
+    """Writes `data` unless the file already holds exactly it (keeping its mtime and ETag)."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    # Per process, so two workers rebuilding at once never share a temp file
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def build(events_path=EVENTS_PATH, out_dir=FEEDS_DIR, force=False):
+    """
+    Brings the feeds in `out_dir` in line with `events_path`. Returns
+    (manifest, rewritten file names). Does no rendering when the source is
+    unchanged since the last build.
+    """
+    try:
+        with open(events_path, "rb") as f:
+            source = f.read()
+    except FileNotFoundError:
+        source = b"[]"
+    source_hash = hashlib.sha256(source).hexdigest()
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    old = _read_manifest(manifest_path)
+    if (not force and old.get("source") == source_hash
+            and all(os.path.exists(os.path.join(out_dir, name)) for name in old.get("files", {}))):
+        return old, []
+
+    events = sorted(json.loads(source), key=lambda e: (str(e["date"]), str(e.get("time", ""))))
+    now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+    old_stamps = old.get("stamps", {})
+    stamps, digests = {}, {}
+    for event in events:
+        key, digest = str(event["id"]), _event_digest(event)
+        previous = old_stamps.get(key)
+        stamps[key] = previous[1] if previous and previous[0] == digest else now
+        digests[key] = [digest, stamps[key]]
+
+    feeds = {feed_name(): (events, CALENDAR_NAME)}
+    for event_type in sorted({e["type"] for e in events if e.get("type")}):
+        feeds[feed_name(event_type)] = ([e for e in events if e.get("type") == event_type], f"{CALENDAR_NAME} - {event_type}")
+
+    os.makedirs(out_dir, exist_ok=True)
+    files, written = {}, []
+    for name, (feed_events, title) in feeds.items():
+        for ext, data in ((".ics", render_ics(feed_events, stamps, title)), (".json", render_json(feed_events, title))):
+            if _write_if_changed(os.path.join(out_dir, name + ext), data):
+                written.append(name + ext)
+            files[name + ext] = hashlib.sha256(data).hexdigest()
+
+    # Feeds for event types that no longer exist
+    for name in old.get("files", {}):
+        if name not in files:
+            try:
+                os.remove(os.path.join(out_dir, name))
+            except FileNotFoundError:
+                pass
+
+    manifest = {"format": FORMAT, "source": source_hash, "stamps": digests, "files": files}
+    _write_if_changed(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return manifest, written
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _feed_urls(path, version):
+    manifest, _ = build(path)
+    return {name: FEEDS_URL + name for name in manifest["files"]}
+
+
+def subscribe_markdown(urls):
+    """One line of links to the .ics feeds (and the full JSON feed), or "" when there are none."""
+    links = [f"[All events]({urls[feed_name() + '.ics']})"] if feed_name() + ".ics" in urls else []
+    prefix = feed_name() + "-"
+    links += [
+        f"[{name[len(prefix):-len('.ics')].replace('-', ' ').title()}]({url})"
+        for name, url in sorted(urls.items())
+        if name.startswith(prefix) and name.endswith(".ics")
+    ]
+    if feed_name() + ".json" in urls:
+        links.append(f"[JSON]({urls[feed_name() + '.json']})")
+    return "📆 Add to your calendar (.ics): " + " · ".join(links) if links else ""
+
+
+def feed_urls(path=EVENTS_PATH):
+    """
+    {file name: /app/static/feeds/ URL}, rebuilding the feeds first if
+    events.json changed. Empty when static serving is off or static/ is read-only.
+    """
+    if not st.get_option("server.enableStaticServing"):
+        return {}
+    try:
+        return _feed_urls(path, file_version(path))
+    except OSError:
+        # Not cached (st.cache_resource keeps no exceptions): the next rerun tries again
+        logger.warning("Could not build the event feeds in %s", FEEDS_DIR, exc_info=True)
+        return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the .ics and JSON event feeds.")
+    parser.add_argument("--events", default=EVENTS_PATH)
+    parser.add_argument("--out", default=FEEDS_DIR)
+    parser.add_argument("--force", action="store_true", help="render even if events.json is unchanged")
+    args = parser.parse_args(argv)
+    manifest, written = build(args.events, args.out, args.force)
+    print(f"{len(manifest['files'])} feeds in {args.out}: {len(written)} rewritten")
+    for name in written:
+        print(f"  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
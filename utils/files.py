@@ -0,0 +1,17 @@
+"""
+File version stamps used as cache keys.
+
+Kept free of other utils imports so that every module can use the same
+helper, including the ones utils.helpers itself imports (assets, styles) and
+the CLIs that avoid importing helpers. utils.helpers re-exports it.
+"""
+import os
+
+
+def file_version(path):
+    """(mtime, size) of a file, or None if it does not exist. Used as a cache key."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
@@ -1,39 +1,97 @@
+import importlib
+import sys
+
 import streamlit as st
-import os
+import utils.assets as assets
+import utils.metrics as metrics
+import utils.styles as styles
+from utils.files import file_version  # noqa: F401  (re-exported for the loaders)
+
+# Site pages, in navigation order
+PAGES = [
+    {"label": "Home", "path": "home.py"},
+    {"label": "Events", "path": "pages/02_Events.py"},
+    {"label": "Community", "path": "pages/03_Community.py"},
+    {"label": "Blog", "path": "pages/04_Blog.py"},
+    {"label": "About", "path": "pages/05_About.py"},
+]
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            # import_module holds the import lock, so concurrent sessions are safe
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+def lazy_import(name):
+    """
+    `name` as a module that is only imported when first used. For heavy
+    dependencies (pandas, PIL) that a page may never reach, so importing a
+    utils module stays cheap on every worker start.
+    """
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+# Only pages that show images pay for PIL
+images = lazy_import("utils.images")
 
-def load_css(theme):
-    """Loads the CSS file based on the theme."""
-    file_name = f"assets/{theme}_style.css"
-    if theme == "light":
-        file_name = "assets/light_style.css"
+def image(path, width="stretch", alt="", sizes=None, loading="lazy"):
+    """
+    st.image for local files in assets/: a <picture> with AVIF/WebP variants
+    in a srcset, so small screens download small files. Falls back to
+    st.image when variants cannot be served.
+    """
+    markup = images.picture_html(path, alt, None if width == "stretch" else width, sizes, loading)
+    if markup is None:
+        st.image(assets.asset_url(path), width=width)
     else:
-        file_name = "assets/style.css"
-        
-    try:
-        with open(file_name) as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
-    except FileNotFoundError:
-        st.error(f"CSS file {file_name} not found.")
+        st.markdown(markup, unsafe_allow_html=True)
+
+def load_css(theme, active_idx=-1):
+    """Loads the cached, minified CSS for the theme (and nav highlight)."""
+    styles.inject(theme, active_idx)
 
 def render_navigation(current_file_path=None):
     """
     Renders the top navigation bar and handles theme toggling.
     This should be called at the very top of every page.
+    It also opens the rerun's timing span (see utils/metrics.py).
     """
+    metrics.start_rerun(current_file_path or "unknown")
     
     # Initialize theme in session state if not present
     if 'theme' not in st.session_state:
         st.session_state.theme = 'light' # Default
         
-    # Toggle logic
+    # Toggle logic. Runs as the button's callback, before the rerun the click
+    # triggers, so that single rerun already paints the new theme. The theme
+    # restyles the whole page, so it is deliberately not a fragment.
     def toggle_theme():
         if st.session_state.theme == 'dark':
             st.session_state.theme = 'light'
         else:
             st.session_state.theme = 'dark'
             
-    # Apply CSS
-    load_css(st.session_state.theme)
+    # Highlight active page logic
+    active_idx = -1
+    for i, page in enumerate(PAGES):
+        if page["path"] == current_file_path:
+            active_idx = i
+            break
+
+    # Apply CSS (theme stylesheet + active highlight, pre-built per process)
+    with metrics.span("css"):
+        load_css(st.session_state.theme, active_idx)
     
     # --- TOP SITES NAVIGATION ---
     # Hide sidebar by default
@@ -51,9 +109,7 @@ def render_navigation(current_file_path=None):
         st.markdown('<div id="mobile-controls"></div>', unsafe_allow_html=True)
         # Theme button (Mobile only)
         btn_label = "☀️" if st.session_state.theme == 'dark' else "🌙"
-        if st.button(btn_label, key="mobile_theme_toggle", help="Toggle Theme"):
-            toggle_theme()
-            st.rerun()
+        st.button(btn_label, key="mobile_theme_toggle", help="Toggle Theme", on_click=toggle_theme)
 
     # --- DESKTOP NAVIGATION ---
     with st.container():
@@ -62,58 +118,18 @@ def render_navigation(current_file_path=None):
         # Using columns to simulate a navbar
         cols = st.columns([1, 1, 1, 1, 1, 0.5]) # Last column for theme toggle
         
-        # Define pages
-        pages = [
-            {"label": "Home", "path": "home.py"},
-            {"label": "Events", "path": "pages/02_Events.py"},
-            {"label": "Community", "path": "pages/03_Community.py"},
-            {"label": "Blog", "path": "pages/04_Blog.py"},
-            {"label": "About", "path": "pages/05_About.py"},
-        ]
-        
-        # Highlight active page logic
-        active_idx = -1
-        for i, page in enumerate(pages):
-            if page["path"] == current_file_path:
-                active_idx = i
-                break
-                
-        # Inject CSS for active highlight if found
-        if active_idx != -1:
-            if st.session_state.theme == "light":
-                st.markdown(f"""
-                <style>
-                div[data-testid="column"]:nth-of-type({active_idx + 1}) a {{
-                    background-color: rgba(0, 212, 255, 0.2) !important; /* Light Cyan transparent */
-                    border: 2px solid #00D4FF !important;
-                    color: #000000 !important; /* Force Black text */
-                    font-weight: bold;
-                    border-radius: 8px !important;
-                    font-size: 1.1rem !important;
-                }}
-                </style>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <style>
-                div[data-testid="column"]:nth-of-type({active_idx + 1}) a {{
-                    background-color: rgba(0, 255, 255, 0.15) !important;
-                    border: 1px solid #00FFFF !important;
-                    color: #FFFFFF !important; /* Force White text */
-                    border-radius: 8px;
-                }}
-                </style>
-                """, unsafe_allow_html=True)
-    
-        for i, page in enumerate(pages):
+        for i, page in enumerate(PAGES):
             with cols[i]:
                 st.page_link(page["path"], label=page["label"], width="stretch")
                 
         with cols[-1]:
             # Theme button (Desktop)
             btn_label = "☀️" if st.session_state.theme == 'dark' else "🌙"
-            if st.button(btn_label, key="desktop_theme_toggle", help="Toggle Theme"):
-                toggle_theme()
-                st.rerun()
+            st.button(btn_label, key="desktop_theme_toggle", help="Toggle Theme", on_click=toggle_theme)
 
     st.markdown("---")
+
+    # Hidden latency view: ?metrics=<QCS_METRICS_TOKEN> on any page
+    if metrics.admin_requested():
+        metrics.render_admin()
+        st.stop()
@@ -0,0 +1,137 @@
+"""
+Responsive variants of raster images in assets/.
+
+Each image is resized to a few widths in AVIF and WebP and written to
+static/img/<name>.<hash>.<width>w.<format>, so a variant is generated once
+per source content and survives restarts. `picture_html` emits a <picture>
+with srcset/sizes so browsers fetch only the pixels they will display.
+
+    python -m utils.images    # pre-generate variants for every image in assets/
+"""
+import functools
+import hashlib
+import html
+import os
+import urllib.parse
+
+import streamlit as st
+
+import utils.assets as assets
+from utils.helpers import file_version, lazy_import
+
+Image = lazy_import("PIL.Image")
+ImageOps = lazy_import("PIL.ImageOps")
+
+VARIANTS_DIR = os.path.join(assets.STATIC_DIR, "img")
+VARIANTS_URL = assets.STATIC_URL + "img/"
+
+# Widths generated for images that stretch with their container
+STRETCH_WIDTHS = (320, 480, 640, 960, 1280)
+# Best format first; <source> order decides what the browser picks
+FORMATS = [
+    ("avif", "image/avif", {"quality": 55, "speed": 8}),
+    ("webp", "image/webp", {"quality": 80, "method": 5}),
+]
+RASTER_EXTS = {".png", ".jpg", ".jpeg"}
+
+
+@functools.cache
+def _formats():
+    """The FORMATS this Pillow build can encode."""
+    from PIL import features
+
+    return [f for f in FORMATS if features.check(f[0])]
+
+
+def _widths(natural, display):
+    """1x/2x for a fixed display width, the stretch ladder otherwise; never upscaled."""
+    wanted = (display, display * 2) if display else STRETCH_WIDTHS
+    return sorted({min(w, natural) for w in wanted})
+
+
+def _prune(stem, digest):
+    """Removes variants of `stem` built from older contents."""
+    prefix = f"{stem}."
+    for name in os.listdir(VARIANTS_DIR):
+        if name.startswith(prefix) and not name.startswith(f"{prefix}{digest}.") and name.count(".") == stem.count(".") + 3:
+            try:
+                os.remove(os.path.join(VARIANTS_DIR, name))
+            except FileNotFoundError:
+                pass
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _variants(path, version, display_width):
+    """
+    Generates any missing variants of `path`. Returns the natural size and
+    {mime: [(file name, width)]}. `version` keys the cache.
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:10]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    os.makedirs(VARIANTS_DIR, exist_ok=True)
+
+    with Image.open(path) as img:
+        img = ImageOps.exif_transpose(img)
+        natural = img.size
+        widths = _widths(natural[0], display_width)
+        sources = {}
+        for fmt, mime, options in _formats():
+            sources[mime] = []
+            for width in widths:
+                name = f"{stem}.{digest}.{width}w.{fmt}"
+                dest = os.path.join(VARIANTS_DIR, name)
+                if not os.path.exists(dest):
+                    height = round(natural[1] * width / natural[0])
+                    resized = img if width == natural[0] else img.resize((width, height), Image.LANCZOS)
+                    tmp = f"{dest}.{os.getpid()}.tmp"
+                    resized.save(tmp, format=fmt.upper(), **options)
+                    os.replace(tmp, dest)
+                sources[mime].append((name, width))
+    _prune(stem, digest)
+    return {"size": natural, "sources": sources}
+
+
+def picture_html(path, alt="", width=None, sizes=None, loading="lazy"):
+    """
+    <picture> markup for a local image at `width` CSS pixels (None = fill the
+    container), or None when static serving is off or the file is missing.
+    The <img> fallback is the original file's static/ copy.
+    """
+    version = file_version(path)
+    if version is None or not _formats() or not st.get_option("server.enableStaticServing"):
+        return None
+    fallback = assets.served_url(path)
+    if fallback is None:
+        return None
+    built = _variants(path, version, width)
+    natural_w, natural_h = built["size"]
+    display_w = width or natural_w
+    display_h = round(natural_h * display_w / natural_w)
+    sizes = sizes or (f"{width}px" if width else "100vw")
+    sources = "".join(
+        f'<source type="{mime}" sizes="{html.escape(sizes, quote=True)}" srcset="'
+        + ", ".join(f"{VARIANTS_URL}{urllib.parse.quote(name)} {w}w" for name, w in variants)
+        + '">'
+        for mime, variants in built["sources"].items()
+    )
+    style = f"width:{width}px;max-width:100%;height:auto" if width else "width:100%;height:auto"
+    return (
+        f"<picture>{sources}"
+        f'<img src="{html.escape(fallback, quote=True)}" alt="{html.escape(alt, quote=True)}" '
+        f'width="{display_w}" height="{display_h}" style="{style}" loading="{loading}" decoding="async">'
+        f"</picture>"
+    )
+
+
+def main():
+    for name in sorted(os.listdir(assets.ASSETS_DIR)):
+        path = os.path.join(assets.ASSETS_DIR, name)
+        if os.path.splitext(name)[1].lower() in RASTER_EXTS:
+            built = _variants(path, file_version(path), None)
+            count = sum(len(v) for v in built["sources"].values())
+            print(f"{path}: {count} variants")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+import bisect
+import html
+import math
+import os
+import unicodedata
+from collections import defaultdict
+from functools import cached_property
+
+import streamlit as st
+
+import utils.sharedcache as sharedcache
+from utils.helpers import file_version, lazy_import
+
+# Imported when members.csv is first read, not when a page imports this module
+pd = lazy_import("pandas")
+
+MEMBERS_PATH = "data/members.csv"
+
+# Public columns of the member table, and its sort options
+TABLE_COLS = ["Name", "Faculty"]
+TABLE_SORTS = {
+    "Default": None,
+    "Name (A-Z)": ("Name", False),
+    "Name (Z-A)": ("Name", True),
+    "Faculty": ("Faculty", False),
+}
+TABLE_PAGE_SIZE = 25
+
+# Only the columns the site actually shows or checks against
+MEMBER_COLS = ["Name", "Student number", "Faculty"]
+MEMBER_DTYPES = {
+    "Name": "string",
+    "Student number": "string",
+    "Faculty": "category",
+}
+
+
+def normalize_student_number(value):
+    """Canonical form used for duplicate checks: no whitespace, case-folded."""
+    return "".join(str(value).split()).upper()
+
+
+def fold(text):
+    """Case-, accent- and whitespace-insensitive form of a name or query."""
+    text = unicodedata.normalize("NFKD", str(text)).casefold()
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.split())
+
+
+def _trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _deletes(word):
+    """The word plus every single-character deletion of it."""
+    return {word} | {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _osa_distance(a, b):
+    """Edit distance counting adjacent transpositions as one edit."""
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class NameIndex:
+    """
+    Search index over member names, built once per members.csv version.
+
+    `find` matches substrings exactly like `str.contains(case=False)` using an
+    n-gram index (every 1-3 character gram -> rows). `closest` is the
+    typo-tolerant fallback: each query word is scored against name words by
+    trigram similarity, or by edit distance 1 (found through a
+    single-deletion index) for short words. Both return row positions into
+    the store's DataFrame.
+    """
+
+    MAX_CACHED = 512
+
+    def __init__(self, names):
+        self._names = [fold(n) if isinstance(n, str) else "" for n in names]
+
+        grams = defaultdict(list)
+        words = defaultdict(list)
+        for row, name in enumerate(self._names):
+            for gram in {name[i:i + n] for n in (1, 2, 3) for i in range(len(name) - n + 1)}:
+                grams[gram].append(row)
+            for word in set(name.split()):
+                words[word].append(row)
+        self._grams = dict(grams)
+
+        # Distinct name words, sorted for prefix lookups, plus a trigram index over them
+        self._words = sorted(words)
+        self._word_rows = [words[w] for w in self._words]
+        word_grams = defaultdict(list)
+        word_deletes = defaultdict(list)
+        self._word_gram_counts = []
+        for wid, word in enumerate(self._words):
+            tgs = _trigrams(word)
+            self._word_gram_counts.append(len(tgs))
+            for tg in tgs:
+                word_grams[tg].append(wid)
+            for variant in _deletes(word):
+                word_deletes[variant].append(wid)
+        self._word_grams = dict(word_grams)
+        self._word_deletes = dict(word_deletes)
+        self._cache = {}
+
+    def __len__(self):
+        return len(self._names)
+
+    def _cached(self, key, compute):
+        result = self._cache.get(key)
+        if result is None:
+            if len(self._cache) >= self.MAX_CACHED:
+                self._cache.clear()
+            result = self._cache[key] = compute()
+        return result
+
+    def find(self, query):
+        """Rows whose name contains `query` (case/accent-insensitive), in file order."""
+        q = fold(query)
+        if not q:
+            return list(range(len(self._names)))
+        return self._cached(("find", q), lambda: self._find(q))
+
+    def _find(self, q):
+        if len(q) <= 3:
+            return list(self._grams.get(q, ()))
+        postings = sorted(
+            (self._grams.get(q[i:i + 3], ()) for i in range(len(q) - 2)),
+            key=len,
+        )
+        candidates = set(postings[0])
+        for rows in postings[1:]:
+            candidates.intersection_update(rows)
+            if not candidates:
+                return []
+        return sorted(row for row in candidates if q in self._names[row])
+
+    def prefix(self, query):
+        """Rows with a name word starting with `query`, in file order."""
+        q = fold(query)
+        start = bisect.bisect_left(self._words, q)
+        end = bisect.bisect_left(self._words, q + "\uffff")
+        rows = set()
+        for rid in range(start, end):
+            rows.update(self._word_rows[rid])
+        return sorted(rows)
+
+    def closest(self, query, threshold=0.3, limit=20):
+        """Rows ranked by how well each query word matches some name word (typos allowed)."""
+        q = fold(query)
+        if not q:
+            return []
+        return self._cached(("closest", q, threshold, limit), lambda: self._closest(q, threshold, limit))
+
+    def _word_matches(self, word, is_last):
+        """{word id: similarity} for name words close to one query word."""
+        tgs = _trigrams(word)
+        shared = defaultdict(int)
+        for tg in tgs:
+            for wid in self._word_grams.get(tg, ()):
+                shared[wid] += 1
+        matches = {wid: n / (len(tgs) + self._word_gram_counts[wid] - n) for wid, n in shared.items()}
+
+        # One typo (including a swapped pair) in a short word defeats trigrams
+        candidates = set()
+        for variant in _deletes(word):
+            candidates.update(self._word_deletes.get(variant, ()))
+        for wid in candidates:
+            other = self._words[wid]
+            if _osa_distance(word, other) <= 1:
+                sim = 1 - 1 / max(len(word), len(other))
+                matches[wid] = max(matches.get(wid, 0.0), sim)
+
+        # The word still being typed counts as a full match for its completions
+        if is_last:
+            start = bisect.bisect_left(self._words, word)
+            end = bisect.bisect_left(self._words, word + "\uffff")
+            for wid in range(start, end):
+                matches[wid] = 1.0
+        return matches
+
+    def _closest(self, q, threshold, limit):
+        query_words = q.split()
+        scores = defaultdict(float)
+        for i, word in enumerate(query_words):
+            best = {}
+            for wid, sim in self._word_matches(word, i == len(query_words) - 1).items():
+                if sim < threshold:
+                    continue
+                for row in self._word_rows[wid]:
+                    if sim > best.get(row, 0.0):
+                        best[row] = sim
+            for row, sim in best.items():
+                scores[row] += sim / len(query_words)
+        ranked = sorted((row for row, s in scores.items() if s >= threshold), key=lambda r: (-scores[r], r))
+        return ranked[:limit]
+
+
+class MemberStore:
+    """
+    Read-only view of members.csv for one file version.
+
+    Holds the trimmed DataFrame plus everything derived from it, so pages can
+    use the aggregates without touching pandas on every rerun.
+    """
+
+    def __init__(self, df, version=None):
+        self.df = df
+        self.version = version
+        counts = df["Faculty"].value_counts()
+        self.faculty_counts = pd.DataFrame({"Faculty": counts.index.astype(str), "Count": counts.to_numpy()})
+        self.faculties = sorted(counts.index.astype(str).tolist())
+        self.student_numbers = frozenset(map(normalize_student_number, df["Student number"].dropna()))
+        self._sort_ranks = {}
+
+    @cached_property
+    def name_index(self):
+        """NameIndex over the Name column, built on first search."""
+        return NameIndex(self.df["Name"].tolist())
+
+    def sort_rank(self, col):
+        """rank[row] = position of `row` when sorted by `col` (folded, ties by file order)."""
+        ranks = self._sort_ranks
+        if col not in ranks:
+            keys = [fold(v) if isinstance(v, str) else "" for v in self.df[col].tolist()]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            rank = [0] * len(order)
+            for pos, row in enumerate(order):
+                rank[row] = pos
+            ranks[col] = rank
+        return ranks[col]
+
+    def search(self, query):
+        """(row positions, fuzzy) for a search box query; all rows if empty."""
+        if not query.strip():
+            return list(range(len(self.df))), False
+        positions = self.name_index.find(query)
+        if positions:
+            return positions, False
+        return self.name_index.closest(query), True
+
+    @property
+    def empty(self):
+        return self.df.empty
+
+    def __len__(self):
+        return len(self.df)
+
+
+def _empty_frame():
+    return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in MEMBER_DTYPES.items()})
+
+
+def read_members(path=MEMBERS_PATH):
+    """Parses the public member columns of a members CSV with compact dtypes."""
+    if not os.path.exists(path):
+        return _empty_frame()
+    df = pd.read_csv(path, usecols=lambda c: c in MEMBER_COLS, dtype=MEMBER_DTYPES)
+    for col, dtype in MEMBER_DTYPES.items():
+        if col not in df.columns:
+            df[col] = pd.Series(dtype=dtype, index=df.index)
+    return df[MEMBER_COLS]
+
+
+def _table_html(rows):
+    """Escaped HTML for the member table; `rows` are (name, faculty) pairs."""
+    head = "".join(f"<th>{col}</th>" for col in TABLE_COLS)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(v)) if isinstance(v, str) else ''}</td>" for v in row) + "</tr>"
+        for row in rows
+    )
+    return f'<table class="member-table"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _table_page(_store, version, query, sort, page, page_size):
+    """One rendered page of the member table. Keyed by (version, query, sort, page)."""
+    positions, fuzzy = _store.search(query)
+    total = len(positions)
+    sort_spec = TABLE_SORTS.get(sort)
+    if sort_spec:
+        col, descending = sort_spec
+        rank = _store.sort_rank(col)
+        positions = sorted(positions, key=rank.__getitem__, reverse=descending)
+    pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    visible = positions[start:start + page_size]
+    rows = _store.df[TABLE_COLS].iloc[visible].itertuples(index=False, name=None)
+    return {
+        "html": _table_html(rows),
+        "total": total,
+        "pages": pages,
+        "page": page,
+        "first": start + 1 if total else 0,
+        "last": start + len(visible),
+        "fuzzy": fuzzy,
+    }
+
+
+def member_table(store, query="", sort="Default", page=1, page_size=TABLE_PAGE_SIZE):
+    """
+    The visible page of the (searched, sorted) member table.
+
+    Only `page_size` rows are serialized; the dict also carries the total
+    match count and page count so callers never build the full table.
+    """
+    return _table_page(store, store.version, query.strip(), sort, page, page_size)
+
+
+def _build_store(path):
+    store = MemberStore(read_members(path))
+    store.name_index  # built now so it is part of the shared copy
+    return store
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_store(path, version):
+    """The store once per (path, version) and process; built once per file content across workers."""
+    store = sharedcache.get_or_build("members", sharedcache.content_key(MemberStore, path), lambda: _build_store(path))
+    store.version = version
+    return store
+
+
+def load_members(path=MEMBERS_PATH):
+    """Returns the MemberStore for the current version of `path`."""
+    return _load_store(path, file_version(path))
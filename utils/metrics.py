@@ -0,0 +1,312 @@
+"""
+Per-rerun render timings.
+
+`helpers.render_navigation` opens a rerun span for the page, and pages wrap
+their data loads, chart builds and HTML rendering in `span(name)`. Fragments
+call `start_fragment` so their own reruns get a span of their own. Every
+message the rerun sends is counted, so each span also carries its payload
+size. A rerun's end is the last message it sent. It is recorded when the
+session's next rerun starts, or when its script thread exits.
+
+Finished reruns are appended as JSON lines to a rotating file (METRICS_PATH)
+and kept in memory for percentiles. These are shown by the hidden admin view
+(`?metrics=<QCS_METRICS_TOKEN>` on any page) and, when QCS_METRICS_PORT is
+set, served in Prometheus text format at http://<host>:<port>/metrics.
+"""
+import collections
+import contextlib
+import hmac
+import html
+import json
+import logging
+import logging.handlers
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+METRICS_PATH = ".cache/metrics.jsonl"
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 3
+# Reruns kept per page for the percentiles
+WINDOW = 2000
+QUANTILES = (0.5, 0.95, 0.99)
+
+ADMIN_TOKEN = os.environ.get("QCS_METRICS_TOKEN")
+PROMETHEUS_PORT = os.environ.get("QCS_METRICS_PORT")
+PROMETHEUS_HOST = os.environ.get("QCS_METRICS_HOST", "127.0.0.1")
+
+# The admin views render on pages that do not load the Community table styles
+ADMIN_TABLE_CSS = """<style>
+.admin-table{width:100%;border-collapse:collapse;color:inherit;font-size:.9rem}
+.admin-table th{text-align:left;padding:8px 10px;background-color:rgba(0,255,255,.1);border-bottom:2px solid #00FFFF}
+.admin-table td{padding:6px 10px;border-bottom:1px solid rgba(128,128,128,.2);vertical-align:top}
+</style>"""
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_open = {}  # session id -> Rerun still running
+_latency = collections.defaultdict(lambda: collections.deque(maxlen=WINDOW))
+_payload = collections.defaultdict(lambda: collections.deque(maxlen=WINDOW))
+_span_totals = collections.defaultdict(lambda: collections.defaultdict(lambda: [0, 0.0, 0]))
+_totals = collections.defaultdict(lambda: [0, 0.0])  # page -> [count, seconds]
+_started = set()
+
+
+class Rerun:
+    """One script run of one page in one session."""
+
+    def __init__(self, page, session_id, thread):
+        self.page = page
+        self.session_id = session_id
+        self.thread = thread
+        self.timestamp = time.time()
+        self.started = time.perf_counter()
+        self.last_activity = self.started
+        self.bytes = 0
+        self.spans = {}
+
+    def sent(self, msg):
+        self.bytes += msg.ByteSize()
+        self.last_activity = time.perf_counter()
+
+    def record(self):
+        return {
+            "ts": round(self.timestamp, 3),
+            "page": self.page,
+            "ms": round((self.last_activity - self.started) * 1000, 2),
+            "bytes": self.bytes,
+            "spans": {name: {"ms": round(s[0], 2), "bytes": s[1]} for name, s in self.spans.items()},
+        }
+
+
+# --- RECORDING ---
+def _file_logger():
+    """JSON-lines logger on a rotating file; without a handler when the directory is read-only."""
+    log = logging.getLogger(f"{__name__}.file")
+    if not log.handlers:
+        log.propagate = False
+        log.setLevel(logging.INFO)
+        try:
+            os.makedirs(os.path.dirname(METRICS_PATH), exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(METRICS_PATH, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            log.addHandler(handler)
+        except OSError:
+            log.addHandler(logging.NullHandler())
+    return log
+
+
+def _finish(rerun):
+    record = rerun.record()
+    with _lock:
+        _latency[rerun.page].append(record["ms"])
+        _payload[rerun.page].append(record["bytes"])
+        totals = _totals[rerun.page]
+        totals[0] += 1
+        totals[1] += record["ms"] / 1000
+        for name, s in record["spans"].items():
+            span_totals = _span_totals[rerun.page][name]
+            span_totals[0] += 1
+            span_totals[1] += s["ms"]
+            span_totals[2] += s["bytes"]
+    _file_logger().info(json.dumps(record))
+
+
+def _reap():
+    """Finishes reruns whose script thread has exited."""
+    while True:
+        time.sleep(1)
+        with _lock:
+            done = [sid for sid, r in _open.items() if not r.thread.is_alive()]
+            finished = [_open.pop(sid) for sid in done]
+        for rerun in finished:
+            _finish(rerun)
+
+
+def _hook(ctx):
+    """
+    Counts every message this script context sends toward the session's open
+    rerun, by wrapping ScriptRunContext._enqueue (private; present in the
+    streamlit versions this was written against). Without it, reruns are
+    still timed but carry no payload sizes.
+    """
+    if getattr(ctx, "_metrics_hooked", False):
+        return
+    if not callable(getattr(ctx, "_enqueue", None)):
+        if "no-enqueue" not in _started:
+            _started.add("no-enqueue")
+            logger.warning("ScriptRunContext has no _enqueue in this streamlit version; payload sizes are not recorded")
+        return
+    enqueue, session_id = ctx._enqueue, ctx.session_id
+
+    def counted(msg):
+        rerun = _open.get(session_id)
+        if rerun is not None:
+            rerun.sent(msg)
+        enqueue(msg)
+
+    ctx._enqueue = counted
+    ctx._metrics_hooked = True
+
+
+def _start_once(name, target):
+    with _lock:
+        if name in _started:
+            return
+        _started.add(name)
+    threading.Thread(target=target, name=f"metrics-{name}", daemon=True).start()
+
+
+def start_rerun(page):
+    """Opens the span for this rerun (closing the session's previous one). No-op outside a script run."""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        return None
+    _hook(ctx)
+    rerun = Rerun(page, ctx.session_id, threading.current_thread())
+    with _lock:
+        previous = _open.pop(ctx.session_id, None)
+        _open[ctx.session_id] = rerun
+    if previous is not None:
+        _finish(previous)
+    _start_once("reaper", _reap)
+    if PROMETHEUS_PORT:
+        _start_once("prometheus", _serve_prometheus)
+    return rerun
+
+
+def start_fragment(page, name):
+    """
+    Opens the span for a fragment-only rerun, recorded as "<page>#<name>".
+    During a full rerun the fragment is part of the page's span, so this does nothing.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None or not ctx.fragment_ids_this_run:
+        return None
+    return start_rerun(f"{page}#{name}")
+
+
+@contextlib.contextmanager
+def span(name):
+    """Times a named part of the current rerun (and the bytes it sends)."""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    rerun = _open.get(ctx.session_id) if ctx is not None else None
+    if rerun is None:
+        yield
+        return
+    start, sent = time.perf_counter(), rerun.bytes
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        s = rerun.spans.setdefault(name, [0.0, 0])
+        s[0] += (end - start) * 1000
+        s[1] += rerun.bytes - sent
+        rerun.last_activity = max(rerun.last_activity, end)
+
+
+# --- REPORTING ---
+def _quantile(values, q):
+    """Nearest-rank quantile of an already sorted list."""
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+
+def summary():
+    """{page: {"count", "p50", "p95", "p99", "bytes", "spans": {name: (avg ms, avg bytes)}}} over the window."""
+    with _lock:
+        latency = {page: sorted(values) for page, values in _latency.items() if values}
+        payload = {page: list(values) for page, values in _payload.items()}
+        spans = {page: {name: list(t) for name, t in names.items()} for page, names in _span_totals.items()}
+    out = {}
+    for page, values in sorted(latency.items()):
+        row = {"count": len(values)}
+        for q in QUANTILES:
+            row[f"p{round(q * 100)}"] = _quantile(values, q)
+        row["bytes"] = sum(payload[page]) / len(payload[page])
+        row["spans"] = {name: (t[1] / t[0], t[2] / t[0]) for name, t in spans.get(page, {}).items()}
+        out[page] = row
+    return out
+
+
+def prometheus_text():
+    lines = [
+        "# HELP qcs_rerun_duration_seconds Streamlit rerun duration by page.",
+        "# TYPE qcs_rerun_duration_seconds summary",
+    ]
+    with _lock:
+        latency = {page: sorted(values) for page, values in _latency.items() if values}
+        totals = {page: list(t) for page, t in _totals.items()}
+    for page, values in sorted(latency.items()):
+        label = page.replace("\\", "\\\\").replace('"', '\\"')
+        for q in QUANTILES:
+            lines.append(f'qcs_rerun_duration_seconds{{page="{label}",quantile="{q}"}} {_quantile(values, q) / 1000:.6f}')
+        lines.append(f'qcs_rerun_duration_seconds_sum{{page="{label}"}} {totals[page][1]:.6f}')
+        lines.append(f'qcs_rerun_duration_seconds_count{{page="{label}"}} {totals[page][0]}')
+    return "\n".join(lines) + "\n"
+
+
+class _PrometheusHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve_prometheus():
+    # One port per process: with several workers sharing QCS_METRICS_PORT only
+    # the first one binds it, and the others log this once and go on without it
+    try:
+        server = ThreadingHTTPServer((PROMETHEUS_HOST, int(PROMETHEUS_PORT)), _PrometheusHandler)
+    except (OSError, ValueError) as e:
+        logger.warning("Metrics endpoint not started on %s:%s (%s); give each worker its own QCS_METRICS_PORT",
+                       PROMETHEUS_HOST, PROMETHEUS_PORT, e)
+        return
+    server.serve_forever()
+
+
+# --- ADMIN VIEW ---
+def admin_requested(param="metrics", token=ADMIN_TOKEN):
+    """
+    True when the URL carries ?<param>=<token>, by default
+    ?metrics=<QCS_METRICS_TOKEN>. Never when no token is configured; a
+    missing or malformed value is simply not a match.
+    """
+    given = st.query_params.get(param)
+    if not token or not isinstance(given, str) or not given:
+        return False
+    # Bytes, since compare_digest rejects non-ASCII str
+    return hmac.compare_digest(given.encode(), token.encode())
+
+
+def render_admin():
+    st.markdown("## ⏱️ Rerun Latency")
+    st.caption(f"Last {WINDOW} reruns per page in this process; the full log is in {METRICS_PATH}.")
+    rows = summary()
+    if not rows:
+        st.info("No reruns recorded yet.")
+        return
+    head = "".join(f"<th>{h}</th>" for h in ("Page", "Reruns", "p50 ms", "p95 ms", "p99 ms", "Avg KB", "Spans (avg ms / KB)"))
+    body = "".join(
+        f"<tr><td>{html.escape(page)}</td><td>{r['count']}</td><td>{r['p50']:.0f}</td><td>{r['p95']:.0f}</td>"
+        f"<td>{r['p99']:.0f}</td><td>{r['bytes'] / 1024:.1f}</td><td>"
+        + "<br>".join(f"{html.escape(name)}: {ms:.1f} / {b / 1024:.1f}" for name, (ms, b) in r["spans"].items())
+        + "</td></tr>"
+        for page, r in rows.items()
+    )
+    st.markdown(ADMIN_TABLE_CSS, unsafe_allow_html=True)
+    st.markdown(f'<table class="admin-table"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>', unsafe_allow_html=True)
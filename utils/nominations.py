@@ -0,0 +1,287 @@
+"""
+Committee nomination tally from the sign-up role preferences.
+
+The sign-up form asks which committee roles a member would stand for (the
+0/1 columns in survey.ROLE_COLS). Ahead of the AGM the committee needs the
+candidate pool per role: how many members are interested, and who they are.
+
+Several years of sign-up exports can be tallied together. Every CSV in
+SOURCES is read once per file version, and a member who signed up more than
+once (same student number) counts once, with their latest answers. Counts
+and pools come from boolean column masks over the combined table, memoized
+per faculty/level filter, so changing a filter never re-reads a file.
+
+    python -m utils.nominations [CSV ...] [--faculty F] [--level L] [--candidates]
+
+In the app the tally is hidden behind ?nominations=<QCS_NOMINATIONS_TOKEN>
+on the About page.
+"""
+import argparse
+import glob
+import html
+import logging
+import os
+import sys
+
+import streamlit as st
+
+import utils.charts as charts
+import utils.metrics as metrics
+import utils.sharedcache as sharedcache
+import utils.survey as survey
+from utils.helpers import file_version, lazy_import
+from utils.members import MEMBERS_PATH
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
+# Earlier years' exports kept under data/signups/, then the current one
+SOURCES = ["data/signups/*.csv", MEMBERS_PATH]
+ADMIN_TOKEN = os.environ.get("QCS_NOMINATIONS_TOKEN")
+COLUMNS = ["Completion time", "Name", "Student number", "Email", "Faculty", "Level", *survey.ROLE_COLS]
+# Completion times as the sign-up form exports them ("9/15/25 13:37:51")
+TIME_FORMAT = "%m/%d/%y %H:%M:%S"
+# Filtered views memoized per pool (one per faculty/level selection)
+MAX_CACHED_FILTERS = 64
+# Candidates listed per role in the admin view; the CSV download has them all
+MAX_LISTED = 200
+
+ROLES = list(survey.ROLE_COLS.values())
+
+
+def sources(patterns=SOURCES):
+    """
+    Existing files matching `patterns`, each once, in pattern order (a glob's
+    matches by name). For SOURCES that is the archived exports, then the
+    current one, so ties in sign-up time go to the newer file.
+    """
+    found = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]:
+            if os.path.isfile(path) and path not in found:
+                found.append(path)
+    return found
+
+
+class NominationPool:
+    """
+    Every member who signed up, once, with their role flags. `people` holds
+    Name, Student number, Faculty, Level and Signed up; `flags[i, r]` is
+    True when member i would stand for ROLES[r].
+    """
+
+    def __init__(self, people, flags, sources):
+        self.people = people
+        self.flags = flags
+        self.sources = sources
+        self.faculties = people["Faculty"].value_counts().index.tolist()
+        self.levels = survey.ordered_levels(people["Level"].unique())
+        self._faculty = people["Faculty"].to_numpy()
+        self._level = people["Level"].to_numpy()
+        # Members interested in more than one role, for the "also standing for others" column
+        self._several = flags.sum(axis=1) > 1
+        self._memo = {}
+
+    def __len__(self):
+        return len(self.people)
+
+    def _mask(self, faculties, levels):
+        mask = np.ones(len(self.people), dtype=bool)
+        if faculties:
+            mask &= np.isin(self._faculty, list(faculties))
+        if levels:
+            mask &= np.isin(self._level, list(levels))
+        return mask
+
+    def _filtered(self, faculties, levels):
+        key = (tuple(sorted(faculties or ())), tuple(sorted(levels or ())))
+        found = self._memo.get(key)
+        if found is None:
+            mask = self._mask(*key)
+            flags = self.flags[mask]
+            found = {
+                "members": int(mask.sum()),
+                "counts": flags.sum(axis=0).tolist(),
+                "several": (flags & self._several[mask, None]).sum(axis=0).tolist(),
+                "mask": mask,
+            }
+            if len(self._memo) >= MAX_CACHED_FILTERS:
+                self._memo.clear()
+            self._memo[key] = found
+        return found
+
+    def tally(self, faculties=(), levels=()):
+        """(members matching the filter, [(role, candidates, of whom also standing for another role)])."""
+        found = self._filtered(faculties, levels)
+        return found["members"], list(zip(ROLES, found["counts"], found["several"]))
+
+    def candidates(self, role, faculties=(), levels=()):
+        """DataFrame of the members who would stand for `role`, by name."""
+        found = self._filtered(faculties, levels)
+        rows = found["mask"] & self.flags[:, ROLES.index(role)]
+        return self.people[rows].sort_values("Name", key=_by_name, kind="stable")
+
+    def to_csv(self, faculties=(), levels=()):
+        """One row per filtered member who would stand for anything, one 0/1 column per role."""
+        found = self._filtered(faculties, levels)
+        rows = found["mask"] & self.flags.any(axis=1)
+        table = self.people[rows].copy()
+        for r, role in enumerate(ROLES):
+            table[role] = self.flags[rows, r].astype(int)
+        return table.sort_values("Name", key=_by_name, kind="stable").to_csv(index=False)
+
+
+def _by_name(names):
+    return names.str.casefold()
+
+
+def _read(path):
+    try:
+        df = pd.read_csv(path, usecols=lambda c: c.strip() in COLUMNS, dtype=str)
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        df = pd.DataFrame()
+    df.columns = df.columns.str.strip()
+    return df.reindex(columns=COLUMNS)
+
+
+def build_pool(paths):
+    """NominationPool straight from the CSVs (the expensive path)."""
+    frames = [_read(path) for path in paths]
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=COLUMNS, dtype=str)
+
+    # Latest sign-up per student; rows without a student number fall back to the email
+    key = df["Student number"].fillna("").str.replace(r"\s+", "", regex=True).str.upper()
+    email = df["Email"].fillna("").str.strip().str.casefold()
+    key = key.where(key != "", email)
+    signed_up = pd.to_datetime(df["Completion time"], format=TIME_FORMAT, errors="coerce")
+    order = pd.DataFrame({"key": key, "signed_up": signed_up}).sort_values("signed_up", kind="stable", na_position="first")
+    keep = ~order["key"].duplicated(keep="last") | (order["key"] == "")
+    df = df.loc[order.index[keep.to_numpy()]].sort_index()
+    signed_up = signed_up.loc[df.index]
+
+    flags = df[list(survey.ROLE_COLS)].apply(pd.to_numeric, errors="coerce").fillna(0).gt(0).to_numpy()
+    people = pd.DataFrame({
+        "Name": df["Name"].fillna("").str.strip(),
+        "Student number": df["Student number"].fillna("").str.strip(),
+        "Faculty": survey.faculty_labels(df["Faculty"]),
+        "Level": survey.level_labels(df["Level"]),
+        "Signed up": signed_up.dt.strftime("%Y-%m-%d").fillna(""),
+    }).reset_index(drop=True)
+    return NominationPool(people, flags, list(paths))
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_pool(paths, versions):
+    return sharedcache.get_or_build("nominations", sharedcache.content_key(NominationPool, *paths), lambda: build_pool(paths))
+
+
+def load_pool(paths=None):
+    """NominationPool for the current versions of `paths` (default: every file in SOURCES)."""
+    paths = tuple(sources() if paths is None else paths)
+    return _load_pool(paths, tuple(file_version(p) for p in paths))
+
+
+# --- ADMIN VIEW ---
+def admin_requested():
+    """True when the URL carries ?nominations=<QCS_NOMINATIONS_TOKEN> (never when no token is configured)."""
+    return metrics.admin_requested("nominations", ADMIN_TOKEN)
+
+
+# A fragment: changing a filter reruns only the tally
+@st.fragment
+def _tally_view(pool):
+    metrics.start_fragment("pages/05_About.py", "nominations")
+    f_col, l_col = st.columns(2)
+    with f_col:
+        faculties = st.multiselect("Faculty", pool.faculties, key="nominations_faculty", placeholder="All faculties")
+    with l_col:
+        levels = st.multiselect("Experience level", pool.levels, key="nominations_level", placeholder="All levels")
+
+    members, rows = pool.tally(faculties, levels)
+    st.caption(f"{members} of {len(pool)} members match the filter.")
+    st.markdown(charts.SURVEY_CSS + metrics.ADMIN_TABLE_CSS, unsafe_allow_html=True)
+    st.markdown(
+        charts.bars_html(tuple(role for role, _, _ in rows), tuple(count for _, count, _ in rows), members),
+        unsafe_allow_html=True,
+    )
+
+    for role, count, several in rows:
+        label = f"{role}: {count} candidate{'s' if count != 1 else ''}"
+        with st.expander(f"{label} ({several} also standing for another role)" if several else label):
+            table = pool.candidates(role, faculties, levels)
+            if table.empty:
+                st.caption("Nobody matching the filter.")
+                continue
+            st.markdown(_candidates_html(table.head(MAX_LISTED)), unsafe_allow_html=True)
+            if len(table) > MAX_LISTED:
+                st.caption(f"First {MAX_LISTED} of {len(table)}; download the CSV for the full list.")
+
+    st.download_button(
+        "Download candidates (CSV)",
+        pool.to_csv(faculties, levels),
+        file_name="nominations.csv",
+        mime="text/csv",
+    )
+
+
+def _candidates_html(table):
+    head = "".join(f"<th>{h}</th>" for h in table.columns)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(v))}</td>" for v in row) + "</tr>"
+        for row in table.itertuples(index=False)
+    )
+    return f'<table class="admin-table"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
+
+
+def render_admin():
+    st.markdown("## 🗳️ Committee Nominations")
+    pool = load_pool()
+    st.caption(
+        "Role preferences from the sign-up form, for the AGM. Each member counts once, with their latest sign-up. "
+        f"Sources: {', '.join(pool.sources) or 'none found'}."
+    )
+    if not len(pool):
+        st.info("No sign-ups found.")
+        return
+    _tally_view(pool)
+
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tally committee role preferences from sign-up exports.")
+    parser.add_argument("csv", nargs="*", help=f"sign-up exports (default: {' '.join(SOURCES)})")
+    parser.add_argument("--faculty", action="append", default=[], help="only this faculty, e.g. Science (repeatable)")
+    parser.add_argument("--level", action="append", default=[], help="only this experience level, e.g. Beginner (repeatable)")
+    parser.add_argument("--candidates", action="store_true", help="also list each role's candidates")
+    args = parser.parse_args(argv)
+
+    import streamlit.logger
+
+    # load_pool is an st.cache_resource function; outside `streamlit run` it
+    # warns on every call. Reading the config first keeps it from resetting the level later.
+    st.get_option("logger.level")
+    streamlit.logger.set_log_level(logging.ERROR)
+    pool = load_pool(sources(args.csv) if args.csv else None)
+    for name, given, known in (("faculty", args.faculty, pool.faculties), ("level", args.level, pool.levels)):
+        unknown = [v for v in given if v not in known]
+        if unknown:
+            print(f"Unknown {name}: {', '.join(unknown)} (known: {', '.join(known)})", file=sys.stderr)
+            return 2
+
+    members, rows = pool.tally(args.faculty, args.level)
+    print(f"{members} of {len(pool)} members from {len(pool.sources)} file(s)")
+    print(f"{'Role':<28}{'Candidates':>12}{'Also other roles':>18}")
+    for role, count, several in rows:
+        print(f"{role:<28}{count:>12}{several:>18}")
+        if args.candidates:
+            for person in pool.candidates(role, args.faculty, args.level).to_dict("records"):
+                print(f"    {person['Name']} ({person['Student number']}, {person['Faculty']}, {person['Level']})")
+    return 0
+
+
+if __name__ == "__main__":
+    # Through the importable module, so pools pickled into the shared cache
+    # name utils.nominations.NominationPool rather than __main__'s copy
+    import utils.nominations
+
+    sys.exit(utils.nominations.main())
@@ -0,0 +1,205 @@
+"""
+Recurring events: an RRULE subset, expanded one month at a time.
+
+A record in events.json repeats when it has an `rrule`, e.g.
+
+    {"id": 12, "title": "QCET Talk", "date": "2026-03-05", "time": "18:00 - 19:00",
+     "rrule": "FREQ=WEEKLY;BYDAY=TH;UNTIL=2026-10-29",
+     "cancelled": ["2026-04-02"],
+     "overrides": {"2026-05-14": {"location": "Snape LT1", "time": "17:00 - 18:00"}}}
+
+`date` is the first occurrence. Supported parts are FREQ (DAILY, WEEKLY,
+MONTHLY, YEARLY), INTERVAL, BYDAY (weekdays for WEEKLY, or e.g. 2TH / -1FR
+for MONTHLY), and UNTIL or COUNT. `cancelled` drops single occurrences. They
+still count toward COUNT, as EXDATE does. `overrides` changes fields of
+single occurrences; to move one to another day, cancel it and add a one-off
+record.
+
+A month is expanded by checking only that month's days against the rule, so
+its cost does not depend on how long the series runs. Each series memoizes
+its months.
+"""
+import calendar
+import datetime
+
+WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+FREQS = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+# Months memoized per series (a month view touches one; an export touches each once)
+MAX_CACHED_MONTHS = 240
+# COUNT is resolved to a last date by walking at most this many months
+MAX_COUNT_MONTHS = 1200
+
+
+def _parse_date(text):
+    text = str(text).strip()
+    if len(text) >= 8 and text[:8].isdigit():
+        return datetime.date(int(text[:4]), int(text[4:6]), int(text[6:8]))
+    return datetime.date.fromisoformat(text[:10])
+
+
+def _parse_byday(value):
+    days = []
+    for part in value.split(","):
+        part = part.strip().upper()
+        code, nth = part[-2:], part[:-2]
+        if code not in WEEKDAYS or (nth and nth.lstrip("+-") and not nth.lstrip("+-").isdigit()):
+            raise ValueError(f"Bad BYDAY entry {part!r}")
+        days.append((int(nth) if nth not in ("", "+", "-") else None, WEEKDAYS.index(code)))
+    return days
+
+
+class Rule:
+    """A parsed RRULE string ("FREQ=WEEKLY;BYDAY=TH;UNTIL=2026-10-29")."""
+
+    def __init__(self, text):
+        parts = {}
+        for item in str(text).split(";"):
+            if item.strip():
+                key, _, value = item.partition("=")
+                parts[key.strip().upper()] = value.strip()
+        self.freq = parts.get("FREQ", "").upper()
+        if self.freq not in FREQS:
+            raise ValueError(f"Unsupported FREQ in {text!r}")
+        self.interval = int(parts.get("INTERVAL", 1))
+        if self.interval < 1:
+            raise ValueError(f"INTERVAL must be positive in {text!r}")
+        self.byday = _parse_byday(parts["BYDAY"]) if parts.get("BYDAY") else []
+        self.until = _parse_date(parts["UNTIL"]) if parts.get("UNTIL") else None
+        self.count = int(parts["COUNT"]) if parts.get("COUNT") else None
+        if self.count is not None and self.until is not None:
+            raise ValueError(f"UNTIL and COUNT are exclusive in {text!r}")
+
+
+class Series:
+    """One recurring record; `month(year, month)` gives its occurrences as event dicts."""
+
+    def __init__(self, record):
+        self.record = dict(record)
+        self.id = record["id"]
+        self.start = _parse_date(record["date"])
+        self.rule = Rule(record["rrule"])
+        self.cancelled = {_parse_date(d) for d in record.get("cancelled", [])}
+        self.overrides = {_parse_date(d): fields for d, fields in record.get("overrides", {}).items()}
+        self.last = self.rule.until
+        if self.rule.count is not None:
+            self.last = self._count_to_last(self.rule.count)
+        self._months = {}
+
+    # --- PATTERN ---
+    def _month_offset(self, year, month):
+        return (year - self.start.year) * 12 + month - self.start.month
+
+    def _pattern(self, year, month):
+        """Days of the month the rule generates, before UNTIL/COUNT/cancellations."""
+        rule, start = self.rule, self.start
+        if self._month_offset(year, month) < 0:
+            return []
+        first = datetime.date(year, month, 1)
+        days_in_month = calendar.monthrange(year, month)[1]
+
+        if rule.freq == "DAILY":
+            offset = (first - start).days
+            k = max(0, -(-offset // rule.interval))
+            day = start + datetime.timedelta(days=k * rule.interval)
+            dates = []
+            while day.year == year and day.month == month:
+                dates.append(day)
+                day += datetime.timedelta(days=rule.interval)
+            return dates
+
+        if rule.freq == "WEEKLY":
+            weekdays = {wd for _, wd in rule.byday} or {start.weekday()}
+            week0 = start - datetime.timedelta(days=start.weekday())
+            dates = []
+            for d in range(1, days_in_month + 1):
+                day = datetime.date(year, month, d)
+                if day >= start and day.weekday() in weekdays and ((day - week0).days // 7) % rule.interval == 0:
+                    dates.append(day)
+            return dates
+
+        if rule.freq == "MONTHLY":
+            if self._month_offset(year, month) % rule.interval:
+                return []
+            if not rule.byday:
+                candidates = [start.day] if start.day <= days_in_month else []
+            else:
+                candidates = []
+                for nth, wd in rule.byday:
+                    matching = [d for d in range(1, days_in_month + 1) if datetime.date(year, month, d).weekday() == wd]
+                    if nth is None:
+                        candidates += matching
+                    elif -len(matching) <= nth <= len(matching) and nth != 0:
+                        candidates.append(matching[nth - 1 if nth > 0 else nth])
+            return sorted(datetime.date(year, month, d) for d in set(candidates) if datetime.date(year, month, d) >= start)
+
+        # YEARLY: the start's month and day, every INTERVAL years
+        if month != start.month or (year - start.year) % rule.interval or start.day > days_in_month:
+            return []
+        return [datetime.date(year, month, start.day)]
+
+    def _count_to_last(self, count):
+        """Date of the COUNT-th occurrence, found once so month views never count from the start."""
+        y, m, seen = self.start.year, self.start.month, 0
+        for _ in range(MAX_COUNT_MONTHS):
+            dates = self._pattern(y, m)
+            if seen + len(dates) >= count:
+                return dates[count - seen - 1]
+            seen += len(dates)
+            y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+        return datetime.date(y, m, 1)
+
+    # --- OCCURRENCES ---
+    def dates(self, year, month):
+        """Occurrence dates in one month, in order."""
+        return [
+            d for d in self._pattern(year, month)
+            if (self.last is None or d <= self.last) and d not in self.cancelled
+        ]
+
+    def month(self, year, month):
+        """Occurrences in one month as event dicts (memoized per month)."""
+        key = (year, month)
+        found = self._months.get(key)
+        if found is None:
+            if self.last is not None and (year, month) > (self.last.year, self.last.month):
+                found = []
+            else:
+                found = [self.occurrence(d) for d in self.dates(year, month)]
+            if len(self._months) >= MAX_CACHED_MONTHS:
+                self._months.clear()
+            self._months[key] = found
+        return found
+
+    def upcoming(self, after, limit):
+        """Up to `limit` occurrences on or after `after`, walking forward a month at a time."""
+        day = max(after, self.start)
+        y, m, found = day.year, day.month, []
+        for _ in range(MAX_COUNT_MONTHS):
+            if self.last is not None and (y, m) > (self.last.year, self.last.month):
+                break
+            found += [e for e in self.month(y, m) if e["date"] >= after]
+            if len(found) >= limit:
+                break
+            y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+        return found[:limit]
+
+    def occurrence(self, day):
+        event = dict(self.record)
+        event.update(self.overrides.get(day, {}))
+        event.update(date=day, id=f"{self.id}@{day.isoformat()}", series=self.id)
+        return event
+
+    def ics_rrule(self, utc_offset):
+        """The rule in RFC 5545 form; UNTIL as the end of that local day in UTC."""
+        rule = self.rule
+        parts = [f"FREQ={rule.freq}"]
+        if rule.interval != 1:
+            parts.append(f"INTERVAL={rule.interval}")
+        if rule.byday:
+            parts.append("BYDAY=" + ",".join(f"{'' if n is None else n}{WEEKDAYS[wd]}" for n, wd in rule.byday))
+        if rule.count is not None:
+            parts.append(f"COUNT={rule.count}")
+        elif rule.until is not None:
+            end = datetime.datetime.combine(rule.until, datetime.time(23, 59, 59)) - utc_offset
+            parts.append(f"UNTIL={end:%Y%m%dT%H%M%SZ}")
+        return ";".join(parts)
@@ -0,0 +1,318 @@
+"""
+Cache shared by every Streamlit worker on a host.
+
+st.cache_data / st.cache_resource live inside one process. When several
+workers run behind a load balancer, each one would otherwise re-parse the
+data files and rebuild charts and thumbnails on its own. The loaders keep
+their in-process caches. On a miss, they go through `get_or_build`, which
+keys the artifact by a hash of the inputs' *contents*. Each artifact is then
+built once per data version for all workers, and the rest unpickle it.
+
+The backend is chosen by QCS_CACHE_BACKEND:
+  sqlite  (default) a SQLite file at QCS_CACHE_PATH, .cache/shared.sqlite3
+  memory  per-process only, e.g. for a single worker or a read-only disk
+The memory backend is also used when the SQLite file cannot be opened.
+
+    python -m utils.sharedcache [--stats] [--clear]    # warm up (default), inspect or empty
+
+Entries are pickles, so the cache file must only be writable by the app.
+"""
+import argparse
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+
+CACHE_PATH = os.environ.get("QCS_CACHE_PATH", ".cache/shared.sqlite3")
+BACKEND = os.environ.get("QCS_CACHE_BACKEND", "sqlite")
+# Bump when the entry format changes; cached classes are keyed by their
+# source instead (pass them to content_key)
+FORMAT = 5
+# Versions kept per namespace (older data versions are dropped on write)
+KEEP_PER_NAMESPACE = 8
+# How long a worker waits for another worker's build before building itself, s
+BUILD_WAIT = 30
+POLL_INTERVAL = 0.05
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _schema(cls):
+    """Digest of the module that defines `cls` (read once per process)."""
+    with open(sys.modules[cls.__module__].__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def content_key(*parts):
+    """
+    Hex digest over file contents and plain values. Strings that name an
+    existing file are hashed by content (a missing file hashes as absent);
+    classes by the source of their module, so a pickle of an older version
+    of a cached class is never loaded; anything else by its repr.
+    """
+    digest = hashlib.sha256(f"{FORMAT}|{sys.version_info[:2]}".encode())
+    for part in parts:
+        if isinstance(part, type):
+            digest.update(f"class:{part.__module__}.{part.__qualname__}:{_schema(part)}".encode())
+        elif isinstance(part, str) and os.path.isfile(part):
+            digest.update(b"file:")
+            with open(part, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        else:
+            digest.update(b"value:" + repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# --- BACKENDS ---
+class MemoryBackend:
+    """Per-process dict; no sharing, but the same interface."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace, key):
+        with self._lock:
+            return self._entries.get((namespace, key))
+
+    def put(self, namespace, key, value):
+        with self._lock:
+            self._entries[(namespace, key)] = value
+            stale = [k for k in self._entries if k[0] == namespace][:-KEEP_PER_NAMESPACE]
+            for k in stale:
+                del self._entries[k]
+
+    def claim(self, namespace, key):
+        return True
+
+    def release(self, namespace, key):
+        pass
+
+    def stats(self):
+        with self._lock:
+            counts = {}
+            for namespace, _ in self._entries:
+                counts[namespace] = counts.get(namespace, 0) + 1
+        return {ns: (n, None) for ns, n in counts.items()}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteBackend:
+    """
+    One SQLite file in WAL mode, readable by many processes at once. A
+    `builds` row marks an artifact that some worker is building, so the
+    others wait for it instead of building it too.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries (namespace TEXT, key TEXT, value BLOB, "
+                "created REAL, PRIMARY KEY (namespace, key))"
+            )
+            db.execute("CREATE TABLE IF NOT EXISTS builds (namespace TEXT, key TEXT, started REAL, PRIMARY KEY (namespace, key))")
+
+    def _connect(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = sqlite3.connect(self.path, timeout=BUILD_WAIT)
+        return db
+
+    def get(self, namespace, key):
+        row = self._connect().execute(
+            "SELECT value FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, namespace, key, value):
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (namespace, key, value, time.time()))
+            db.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key NOT IN "
+                "(SELECT key FROM entries WHERE namespace = ? ORDER BY created DESC LIMIT ?)",
+                (namespace, namespace, KEEP_PER_NAMESPACE),
+            )
+
+    def claim(self, namespace, key):
+        """True if this worker should build the entry (nobody else is, or they gave up)."""
+        now = time.time()
+        with self._connect() as db:
+            db.execute("DELETE FROM builds WHERE started < ?", (now - BUILD_WAIT,))
+            cursor = db.execute("INSERT OR IGNORE INTO builds VALUES (?, ?, ?)", (namespace, key, now))
+        return cursor.rowcount == 1
+
+    def release(self, namespace, key):
+        with self._connect() as db:
+            db.execute("DELETE FROM builds WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def stats(self):
+        rows = self._connect().execute(
+            "SELECT namespace, COUNT(*), SUM(LENGTH(value)) FROM entries GROUP BY namespace ORDER BY namespace"
+        ).fetchall()
+        return {ns: (n, size) for ns, n, size in rows}
+
+    def clear(self):
+        with self._connect() as db:
+            db.execute("DELETE FROM entries")
+            db.execute("DELETE FROM builds")
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def backend():
+    """The configured backend, opened once per process."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if BACKEND == "sqlite":
+                try:
+                    _backend = SQLiteBackend(CACHE_PATH)
+                except (OSError, sqlite3.Error):
+                    logger.warning("Shared cache at %s is unavailable; using per-process memory", CACHE_PATH)
+            elif BACKEND != "memory":
+                logger.warning("Unknown QCS_CACHE_BACKEND %r; using per-process memory", BACKEND)
+            if _backend is None:
+                _backend = MemoryBackend()
+        return _backend
+
+
+# --- LOOKUP ---
+def _load(store, namespace, key):
+    try:
+        value = store.get(namespace, key)
+        return None if value is None else (pickle.loads(value),)
+    except (sqlite3.Error, pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+        logger.warning("Ignoring unreadable shared cache entry %s/%s", namespace, key[:12])
+        return None
+
+
+def get_or_build(namespace, key, build):
+    """
+    The artifact stored under (namespace, key), or `build()` stored there for
+    the other workers. While another worker is building the same entry, this
+    waits up to BUILD_WAIT seconds for it before building locally. Cache
+    failures never fail the caller; the value is then simply built here.
+    """
+    store = backend()
+    if isinstance(store, MemoryBackend):
+        found = store.get(namespace, key)
+        if found is None:
+            found = build()
+            store.put(namespace, key, found)
+        return found
+
+    found = _load(store, namespace, key)
+    if found is not None:
+        return found[0]
+    try:
+        claimed = store.claim(namespace, key)
+    except sqlite3.Error:
+        return build()
+    if not claimed:
+        deadline = time.monotonic() + BUILD_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            found = _load(store, namespace, key)
+            if found is not None:
+                return found[0]
+    try:
+        value = build()
+        try:
+            store.put(namespace, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError):
+            logger.warning("Could not store %s in the shared cache", namespace, exc_info=True)
+        return value
+    finally:
+        if claimed:
+            try:
+                store.release(namespace, key)
+            except sqlite3.Error:
+                pass
+
+
+# --- WARM-UP ---
+def warm():
+    """Builds every shared artifact for the current data, so the first visitors hit a warm cache."""
+    import utils.assets as assets
+    import utils.avatars as avatars
+    import utils.blogs as blogs
+    import utils.charts as charts
+    import utils.committee as committee
+    import utils.events as events
+    import utils.images as images
+    import utils.members as members
+    import utils.nominations as nominations
+    import utils.survey as survey
+
+    timings = []
+
+    def step(label, fn):
+        start = time.perf_counter()
+        fn()
+        timings.append((label, (time.perf_counter() - start) * 1000))
+
+    store = {}
+    # First: blog posts link their PDFs through the static/ manifest
+    step("static assets", assets.build)
+    step("members", lambda: store.setdefault("members", members.load_members()))
+    step("survey", survey.load_stats)
+    step("nominations", nominations.load_pool)
+    step("events", events.load_index)
+    step("blogs", blogs.load_blogs)
+    step("committee avatars", lambda: avatars.avatar_css([m["image"] for m in committee.load_committee()]))
+    for theme in ("light", "dark"):
+        step(f"faculty chart ({theme})", lambda theme=theme: charts.build_faculty_figure(store["members"], theme))
+    step("image variants", images.main)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm up or inspect the cache shared by all workers.")
+    parser.add_argument("--stats", action="store_true", help="list entries per namespace and exit")
+    parser.add_argument("--clear", action="store_true", help="remove every entry and exit")
+    args = parser.parse_args(argv)
+
+    import streamlit as st
+    import streamlit.logger
+
+    # The loaders are st.cache_* functions; outside `streamlit run` they warn on
+    # every call. Reading the config first keeps it from resetting the level later.
+    st.get_option("logger.level")
+    streamlit.logger.set_log_level(logging.ERROR)
+    store = backend()
+    if args.clear:
+        store.clear()
+        print(f"Cleared {CACHE_PATH}")
+        return 0
+    if not args.stats:
+        if isinstance(store, MemoryBackend):
+            print("Shared cache is per-process (QCS_CACHE_BACKEND=memory or unwritable path); nothing to warm")
+            return 1
+        for label, ms in warm():
+            print(f"  {label:<28}{ms:>9.0f} ms")
+    for namespace, (count, size) in store.stats().items():
+        print(f"{namespace:<20}{count:>4} entries{'' if size is None else f'{size / 1024:>10.1f} KB'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
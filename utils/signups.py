@@ -0,0 +1,217 @@
+import csv
+import io
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+import utils.members as members
+from utils.files import file_version
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+PROSPECTIVE_PATH = "data/prospective_members.csv"
+PROSPECTIVE_COLS = ["Name", "Student number", "Faculty", "Email", "Date Joined"]
+
+# Group submissions arriving within this window into one write + fsync.
+# 0 writes (and fsyncs) every sign-up on its own.
+BATCH_WINDOW = float(os.environ.get("QCS_SIGNUP_BATCH_MS", "0")) / 1000
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def _file_lock(f):
+    """Exclusive lock on an open file, held across processes."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SignupStore:
+    """
+    Append-only writer for the prospective members CSV.
+
+    Rows are appended under a file lock (so several Streamlit processes can
+    share the file) and fsynced before `add` returns. The set of registered
+    student numbers is kept in memory and only the newly appended tail of the
+    file is read when another process has written to it.
+    """
+
+    def __init__(self, path=PROSPECTIVE_PATH, batch_window=BATCH_WINDOW):
+        self.path = path
+        self.batch_window = batch_window
+        self._lock = threading.Lock()
+        self._flushed = threading.Condition(self._lock)
+        self._header = None
+        self._student_numbers = set()
+        self._offset = 0
+        self._stat = None
+        self._pending = []
+        self._flushing = False
+
+    # --- INDEX ---
+    def _rebuild(self):
+        self._header = None
+        self._student_numbers = set()
+        self._offset = 0
+        found = self._read_tail()
+        # Keep numbers that are queued but not yet written
+        self._student_numbers.update(_number(e["row"]) for e in self._pending)
+        return found
+
+    def _read_tail(self):
+        """Indexes rows appended since the last read; returns their student numbers."""
+        found = set()
+        # Stat before reading so a concurrent append is noticed on the next sync
+        self._stat = file_version(self.path)
+        if self._stat is None:
+            return found
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read()
+        # Only consume complete lines; a partial last line is picked up next time
+        end = chunk.rfind(b"\n") + 1
+        reader = csv.reader(io.StringIO(chunk[:end].decode("utf-8")))
+        if self._header is None:
+            self._header = next(reader, None)
+        if self._header and "Student number" in self._header:
+            col = self._header.index("Student number")
+            found = {members.normalize_student_number(row[col]) for row in reader if len(row) > col}
+            self._student_numbers.update(found)
+        self._offset += end
+        return found
+
+    def _sync(self):
+        """Brings the index up to date with the file on disk (lock held)."""
+        current = file_version(self.path)
+        if current == self._stat:
+            return
+        if current is None or current[1] < self._offset:
+            # Deleted, truncated or rewritten by hand
+            found = self._rebuild()
+        else:
+            found = self._read_tail()
+        # Another process registered a number we have queued: drop ours
+        for entry in self._pending:
+            if _number(entry["row"]) in found:
+                entry["duplicate"] = True
+
+    def __contains__(self, student_number):
+        with self._lock:
+            self._sync()
+            return members.normalize_student_number(student_number) in self._student_numbers
+
+    # --- WRITES ---
+    def add(self, row):
+        """
+        Appends `row` (a dict keyed by column name) unless its student number is
+        already registered. Returns True once the row is durably on disk and
+        False for a duplicate. A failed write raises in every submitter of the
+        batch, so it is never reported as a duplicate.
+        """
+        with self._lock:
+            self._sync()
+            student_number = _number(row)
+            if student_number in self._student_numbers:
+                return False
+            self._student_numbers.add(student_number)
+            entry = {"row": row, "done": False, "duplicate": False, "added": False, "error": None}
+            self._pending.append(entry)
+            leader = not self._flushing
+            self._flushing = True
+
+        if leader:
+            # Let a burst of submissions queue up behind us, then write them all
+            if self.batch_window:
+                time.sleep(self.batch_window)
+            with self._lock:
+                batch = list(self._pending)
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    logger.exception("Could not write %d sign-up(s) to %s", len(batch), self.path)
+                    for queued in batch:
+                        queued["error"] = e
+                        if not queued["duplicate"]:
+                            self._student_numbers.discard(_number(queued["row"]))
+                finally:
+                    del self._pending[:len(batch)]
+                    for queued in batch:
+                        queued["done"] = True
+                    self._flushing = False
+                    self._flushed.notify_all()
+
+        with self._lock:
+            while not entry["done"]:
+                self._flushed.wait()
+        if entry["error"] is not None:
+            raise entry["error"]
+        return entry["added"]
+
+    def _write(self, batch):
+        """Appends a batch of rows with a single fsync (lock held)."""
+        with open(self.path, "ab+") as f:
+            with _file_lock(f):
+                # Rows another process appended before we got the lock
+                self._sync()
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                buf = io.StringIO()
+                writer = csv.writer(buf, lineterminator="\n")
+                if size == 0:
+                    self._header = list(PROSPECTIVE_COLS)
+                    writer.writerow(self._header)
+                else:
+                    f.seek(size - 1)
+                    if f.read(1) != b"\n":
+                        buf.write("\n")
+                for queued in batch:
+                    if queued["duplicate"]:
+                        continue
+                    writer.writerow([queued["row"].get(col, "") for col in self._header])
+                    queued["added"] = True
+                f.write(buf.getvalue().encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                stat = os.fstat(f.fileno())
+                self._offset = stat.st_size
+                self._stat = (stat.st_mtime_ns, stat.st_size)
+
+
+def _number(row):
+    return members.normalize_student_number(row["Student number"])
+
+
+@st.cache_resource(show_spinner=False)
+def get_store(path=PROSPECTIVE_PATH):
+    """The process-wide SignupStore for `path`, shared by every session."""
+    return SignupStore(path)
+
+
+def is_registered(student_number):
+    """
+    True if the student number is already a member or a pending sign-up.
+    Both lookups are set membership on normalized numbers (see
+    members.normalize_student_number), so `mrxlia001 ` matches `MRXLIA001`.
+    """
+    key = members.normalize_student_number(student_number)
+    return key in members.load_members().student_numbers or key in get_store()
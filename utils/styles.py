@@ -0,0 +1,176 @@
+import difflib
+import re
+
+import streamlit as st
+
+from utils.files import file_version
+
+# Theme name -> stylesheet on disk
+THEME_FILES = {
+    "dark": "assets/style.css",
+    "light": "assets/light_style.css",
+}
+
+# Active navigation tab highlight, formatted with the 1-based column index
+ACTIVE_TAB_CSS = {
+    "light": """
+div[data-testid="column"]:nth-of-type({n}) a {{
+    background-color: rgba(0, 212, 255, 0.2) !important; /* Light Cyan transparent */
+    border: 2px solid #00D4FF !important;
+    color: #000000 !important; /* Force Black text */
+    font-weight: bold;
+    border-radius: 8px !important;
+    font-size: 1.1rem !important;
+}}
+""",
+    "dark": """
+div[data-testid="column"]:nth-of-type({n}) a {{
+    background-color: rgba(0, 255, 255, 0.15) !important;
+    border: 1px solid #00FFFF !important;
+    color: #FFFFFF !important; /* Force White text */
+    border-radius: 8px;
+}}
+""",
+}
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"\s*([{};:,>])\s*")
+_PROPERTY_RE = re.compile(r"([-\w]+)\s*:(?![^{};]*\{)")
+
+
+def minify(css):
+    """Strips comments and redundant whitespace from a stylesheet."""
+    css = _COMMENT_RE.sub("", css)
+    css = _SPACE_RE.sub(" ", css)
+    css = _PUNCT_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def split_rules(css):
+    """Splits minified CSS into its top-level rules (at-rules kept whole)."""
+    rules, depth, start = [], 0, 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+        elif ch == ";" and depth == 0:
+            # Statement at-rules such as @import
+            rules.append(css[start:i + 1])
+            start = i + 1
+    return [r.strip() for r in rules if r.strip()]
+
+
+def _properties(rule):
+    """Property names declared by a rule (including inside @media blocks)."""
+    if rule.startswith("@import"):
+        return {"@import"}
+    return set(_PROPERTY_RE.findall(rule))
+
+
+def _overlaps(props, others):
+    """
+    True if any property in `props` can override one in `others`, counting
+    shorthands (`border` vs `border-color`). Rules that do not overlap can
+    swap order without changing the cascade.
+    """
+    for p in props:
+        for q in others:
+            if p == q or p.startswith(q + "-") or q.startswith(p + "-"):
+                return True
+    return False
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_rules(path, version):
+    """Reads and minifies one theme file. `version` keys the cache."""
+    with open(path) as f:
+        return split_rules(minify(f.read()))
+
+
+def _theme_rules():
+    rules = {}
+    for theme, path in THEME_FILES.items():
+        version = file_version(path)
+        rules[theme] = _load_rules(path, version) if version is not None else []
+    return rules
+
+
+def _hoist_shared(dark, light):
+    """
+    Splits two rule lists into (shared, dark_only, light_only).
+
+    A rule found in both themes is moved into the shared block only when no
+    theme-specific rule before it touches the same properties, so emitting
+    shared + theme block renders exactly like the original stylesheet.
+    """
+    matcher = difflib.SequenceMatcher(None, dark, light, autojunk=False)
+    shared_pairs = []
+    for block in matcher.get_matching_blocks():
+        shared_pairs.extend((block.a + k, block.b + k) for k in range(block.size))
+
+    shared, hoisted_dark, hoisted_light = [], set(), set()
+    for i, j in shared_pairs:
+        props = _properties(dark[i])
+        deferred = set().union(
+            *(_properties(r) for k, r in enumerate(dark[:i]) if k not in hoisted_dark),
+            *(_properties(r) for k, r in enumerate(light[:j]) if k not in hoisted_light),
+        )
+        if _overlaps(props, deferred):
+            continue
+        shared.append(dark[i])
+        hoisted_dark.add(i)
+        hoisted_light.add(j)
+
+    dark_only = [r for k, r in enumerate(dark) if k not in hoisted_dark]
+    light_only = [r for k, r in enumerate(light) if k not in hoisted_light]
+    return shared, dark_only, light_only
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _build_blocks(versions):
+    """Builds the shared and per-theme blocks. `versions` keys the cache."""
+    rules = _theme_rules()
+    shared, dark_only, light_only = _hoist_shared(rules["dark"], rules["light"])
+    return {
+        "shared": "".join(shared),
+        "dark": "".join(dark_only),
+        "light": "".join(light_only),
+    }
+
+
+def stylesheet_blocks():
+    """Returns the {'shared', 'dark', 'light'} CSS blocks, rebuilt on file change."""
+    versions = tuple((path, file_version(path)) for path in THEME_FILES.values())
+    return _build_blocks(versions)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _theme_block(theme, active_idx, versions):
+    css = stylesheet_blocks()[theme]
+    if active_idx != -1:
+        css += minify(ACTIVE_TAB_CSS[theme].format(n=active_idx + 1))
+    return f"<style>{css}</style>"
+
+
+def inject(theme, active_idx=-1):
+    """
+    Injects the site stylesheet for `theme`, highlighting nav column `active_idx`.
+
+    The shared rules are emitted as one element whose content never changes
+    between themes, followed by a small pre-built block per (theme, page).
+    A theme toggle therefore only swaps the second element.
+    """
+    theme = "light" if theme == "light" else "dark"
+    if file_version(THEME_FILES[theme]) is None:
+        st.error(f"CSS file {THEME_FILES[theme]} not found.")
+        return
+    versions = tuple((path, file_version(path)) for path in THEME_FILES.values())
+    blocks = stylesheet_blocks()
+    if blocks["shared"]:
+        st.markdown(f"<style>{blocks['shared']}</style>", unsafe_allow_html=True)
+    st.markdown(_theme_block(theme, active_idx, versions), unsafe_allow_html=True)
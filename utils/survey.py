@@ -0,0 +1,125 @@
+"""
+Aggregates of the sign-up survey columns in members.csv.
+
+`Level`, the semicolon-separated `Reasons` and `Interest` lists, and the
+role-preference flags are parsed in one vectorized pass per file version,
+and shared across workers through utils.sharedcache. Only the counts are
+kept, as plain lists, so rendering the charts needs neither pandas nor any
+recomputation on a rerun.
+"""
+import streamlit as st
+
+import utils.sharedcache as sharedcache
+from utils.helpers import file_version, lazy_import
+from utils.members import MEMBERS_PATH
+
+pd = lazy_import("pandas")
+
+# Role-preference columns (0/1 flags) and how the dashboard labels them
+ROLE_COLS = {
+    "Executive Chair": "Executive Chair",
+    "Vice Chair": "Vice Chair",
+    "Secretary General": "Secretary General",
+    "Treasurer": "Treasurer",
+    "SMMM": "Social Media & Marketing",
+    "Non_exec": "Non-executive",
+}
+SURVEY_COLS = ["Faculty", "Level", "Reasons", "Interest", *ROLE_COLS]
+# Experience levels in increasing order; anything else is listed after them
+LEVEL_ORDER = ["None", "Beginner", "Intermediate", "Advanced"]
+# Interests shown in the co-occurrence matrix (the most frequent ones)
+MAX_MATRIX_INTERESTS = 10
+
+# "Beginner - I have..." / "Exploring: I am..." -> the short label before the explanation
+_LABEL_RE = r"^\s*([^:\-–]+?)\s*(?:[:\-–].*)?$"
+
+
+class SurveyStats:
+    """Counts for one members.csv version; every field is a plain list."""
+
+    def __init__(self, respondents, interests, reasons, roles, matrix_labels, matrix, levels, faculties, level_counts):
+        self.respondents = respondents
+        self.interests = interests          # [(interest, members)] most frequent first
+        self.reasons = reasons              # [(reason, members)]
+        self.roles = roles                  # [(role, members interested)]
+        self.matrix_labels = matrix_labels  # interests in the co-occurrence matrix
+        self.matrix = matrix                # matrix[i][j] = members listing both i and j
+        self.levels = levels                # experience levels, in order
+        self.faculties = faculties          # faculties, largest first
+        self.level_counts = level_counts    # level_counts[f][l] = members of faculty f at level l
+
+
+def _split_list(series):
+    """0/1 indicator frame of a ';'-separated column, one column per distinct (trimmed) value."""
+    cleaned = series.fillna("").astype(str).str.replace(r"\s*;\s*", ";", regex=True).str.strip("; ")
+    return cleaned.str.get_dummies(sep=";").drop(columns="", errors="ignore")
+
+
+def level_labels(series):
+    """Short experience labels ("Beginner - I have..." -> "Beginner"); blanks become "Not given"."""
+    return series.str.extract(_LABEL_RE, expand=False).str.strip().fillna("Not given")
+
+
+def faculty_labels(series):
+    """Faculty names without the "Faculty of" prefix; blanks become "Not given"."""
+    return series.fillna("Not given").str.replace(r"^Faculty of (the )?", "", regex=True)
+
+
+def ordered_levels(levels):
+    """`levels` in LEVEL_ORDER, any others after them alphabetically."""
+    return [l for l in LEVEL_ORDER if l in levels] + sorted(l for l in set(levels) if l not in LEVEL_ORDER)
+
+
+def _ranked(counts):
+    return [(str(label), int(n)) for label, n in counts.sort_values(ascending=False, kind="stable").items() if n > 0]
+
+
+def build_stats(path=MEMBERS_PATH):
+    """SurveyStats straight from the CSV (the expensive path)."""
+    try:
+        df = pd.read_csv(path, usecols=lambda c: c.strip() in SURVEY_COLS, dtype=str)
+    except FileNotFoundError:
+        df = pd.DataFrame()
+    df.columns = df.columns.str.strip()
+    for col in SURVEY_COLS:
+        if col not in df.columns:
+            df[col] = pd.Series(dtype=str, index=df.index)
+
+    interests = _split_list(df["Interest"])
+    reasons = _split_list(df["Reasons"].str.replace(r":[^;]*", "", regex=True))
+    roles = df[list(ROLE_COLS)].apply(pd.to_numeric, errors="coerce").fillna(0).gt(0).sum()
+    roles.index = [ROLE_COLS[c] for c in roles.index]
+
+    # Co-occurrence of the most frequent interests: one matrix product over the indicators
+    top = [label for label, _ in _ranked(interests.sum())][:MAX_MATRIX_INTERESTS]
+    onehot = interests[top].to_numpy(dtype="int64")
+    matrix = (onehot.T @ onehot).tolist()
+
+    levels = level_labels(df["Level"])
+    faculties = faculty_labels(df["Faculty"])
+    table = pd.crosstab(faculties, levels)
+    level_names = ordered_levels(table.columns)
+    table = table.reindex(columns=level_names, fill_value=0)
+    table = table.loc[table.sum(axis=1).sort_values(ascending=False, kind="stable").index]
+
+    return SurveyStats(
+        respondents=len(df),
+        interests=_ranked(interests.sum()),
+        reasons=_ranked(reasons.sum()),
+        roles=_ranked(roles),
+        matrix_labels=top,
+        matrix=matrix,
+        levels=level_names,
+        faculties=[str(f) for f in table.index],
+        level_counts=table.to_numpy().tolist(),
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_stats(path, version):
+    return sharedcache.get_or_build("survey", sharedcache.content_key(SurveyStats, path), lambda: build_stats(path))
+
+
+def load_stats(path=MEMBERS_PATH):
+    """SurveyStats for the current version of `path`, computed once per file content."""
+    return _load_stats(path, file_version(path))